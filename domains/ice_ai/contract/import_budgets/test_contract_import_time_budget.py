@@ -0,0 +1,138 @@
+"""
+Contract tests for ice_ai import-time budgets.
+
+Startup latency of ICE agent workers is dominated by imports.
+These tests guarantee that cold-importing each public ice_ai module
+stays within the budget recorded in:
+
+    governance/regression/import_budgets.json
+
+The file lists the measured modules; a module without a recorded
+budget is skipped.
+
+Each measurement times the whole ``import`` statement in a fresh
+interpreter, parent packages included; interpreter startup is excluded.
+Measurements are benchmarks: they run with ``ci_entrypoint.sh
+--benchmarks`` (no xdist), never in tier-1.
+
+Budgets are recorded on the benchmark runners with
+``--ice-import-budgets-save``. Raising a budget is a deliberate,
+reviewed change to that file.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tooling.pytest.plugins.import_budgets import (
+    DEFAULT_BUDGETS,
+    SCHEMA_VERSION,
+    is_recording,
+    record_import_time,
+)
+
+
+# ============================================================
+# MARKERS
+# ============================================================
+
+pytestmark = [
+    pytest.mark.contract,
+    pytest.mark.domain,
+]
+
+
+# ============================================================
+# BUDGETS
+# ============================================================
+
+BUDGETS_FILE = Path(__file__).resolve().parents[4] / DEFAULT_BUDGETS
+
+# Best-of-N filters scheduler noise out of a single cold import.
+RUNS = 3
+
+
+def _load_budgets() -> dict:
+    data = json.loads(BUDGETS_FILE.read_text(encoding="utf-8"))
+    assert data["schema_version"] == SCHEMA_VERSION
+    assert data["unit"] == "us"
+    return data
+
+
+DATA = _load_budgets()
+MODULES = DATA["modules"]
+BUDGETS = DATA["budgets"]
+
+
+# Times the import statement itself: ``-X importtime`` reports a
+# submodule's parent packages on separate lines, outside its cumulative
+# time.
+TIMED_IMPORT = (
+    "import time\n"
+    "start = time.perf_counter_ns()\n"
+    "import {module}\n"
+    "print((time.perf_counter_ns() - start) // 1000)\n"
+)
+
+
+def measure_cold_import(module: str) -> int:
+    """
+    Returns the cold import time of a module and its parent packages,
+    in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", TIMED_IMPORT.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(result.stdout.strip().splitlines()[-1])
+
+
+# ============================================================
+# BUDGET TESTS
+# ============================================================
+
+def test_import_budgets_are_positive_integers():
+    """
+    Invariant:
+    Every budget belongs to a listed ice_ai module and is a positive
+    number of microseconds.
+    """
+    assert MODULES
+
+    for module in MODULES:
+        assert module == "ice_ai" or module.startswith("ice_ai.")
+
+    for module, budget in BUDGETS.items():
+        assert module in MODULES
+        assert isinstance(budget, int)
+        assert budget > 0
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("module", sorted(MODULES))
+def test_cold_import_stays_within_budget(request, module):
+    """
+    Invariant:
+    Cold-importing a module never exceeds its recorded budget.
+    """
+    budget = BUDGETS.get(module)
+    if budget is None and not is_recording(request.config):
+        pytest.skip(f"no import budget recorded for {module}")
+
+    best = min(measure_cold_import(module) for _ in range(RUNS))
+    record_import_time(request.node, module, best)
+
+    if is_recording(request.config):
+        return
+
+    assert best <= budget, (
+        f"cold import of {module} took {best} us "
+        f"(budget {budget} us, see {BUDGETS_FILE.name})"
+    )
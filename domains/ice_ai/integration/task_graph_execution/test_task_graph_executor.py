@@ -0,0 +1,172 @@
+import threading
+import time
+
+import pytest
+
+from ice_ai.reasoning.executor import TaskGraphExecutor
+
+from tooling.helpers.task_graph_shapes import GraphShape, fan_out, random_dag
+from tooling.helpers.task_graph_workloads import HANDLERS, workload_graph
+
+
+# a -> b
+PAIR = GraphShape("pair", ("a", "b"), (("a", "b"),))
+
+
+# ---------------------------------------------------------------------
+# CORRECTNESS
+# ---------------------------------------------------------------------
+
+@pytest.mark.integration
+@pytest.mark.domain
+@pytest.mark.parametrize("pool", ["thread", "process"])
+def test_executor_runs_every_node_once_with_its_handler(pool):
+    """
+    Invariant:
+    Every node runs exactly once, through the handler of its kind,
+    and its return value is reported.
+    """
+
+    graph = workload_graph(random_dag(30), "sleep", seconds=0.001)
+
+    report = TaskGraphExecutor(HANDLERS, max_workers=4, pool=pool).run(graph)
+
+    assert report.succeeded is True
+    assert set(report.outcomes) == {f"n{idx}" for idx in range(30)}
+    for node_id, outcome in report.outcomes.items():
+        assert outcome.status == "succeeded"
+        assert outcome.result == node_id
+        assert outcome.error is None
+
+
+@pytest.mark.integration
+@pytest.mark.domain
+def test_executor_starts_nodes_after_their_dependencies_finish():
+    """
+    Invariant:
+    A node never starts before every one of its dependencies finished.
+    """
+
+    shape = random_dag(60, parents=3, window=10)
+    graph = workload_graph(shape, "sleep", seconds=0.002)
+
+    report = TaskGraphExecutor(HANDLERS, max_workers=8).run(graph)
+
+    for source, target in shape.edges:
+        assert report.outcomes[target].started >= report.outcomes[source].finished
+
+
+@pytest.mark.integration
+@pytest.mark.domain
+def test_executor_bounds_concurrency_by_max_workers():
+    """
+    Invariant:
+    At most max_workers handlers run at the same time.
+    """
+
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def tracked(node):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return node.id
+
+    graph = workload_graph(fan_out(20), "tracked")
+
+    report = TaskGraphExecutor({"tracked": tracked}, max_workers=3).run(graph)
+
+    assert report.succeeded is True
+    assert peak == 3
+
+
+@pytest.mark.integration
+@pytest.mark.domain
+def test_executor_cancels_dependents_of_failed_node():
+    """
+    Invariant:
+    A failed node cancels its transitive dependents without running
+    them; independent branches still complete.
+    """
+
+    #  a -> bad -> c -> d
+    #  a -> e
+    shape = GraphShape(
+        "failing_branch",
+        ("a", "bad", "c", "d", "e"),
+        (("a", "bad"), ("bad", "c"), ("c", "d"), ("a", "e")),
+    )
+    graph = workload_graph(shape, "sleep", kinds={"bad": "fail"}, seconds=0.01)
+
+    report = TaskGraphExecutor(HANDLERS, max_workers=2).run(graph)
+
+    statuses = {node_id: outcome.status for node_id, outcome in report.outcomes.items()}
+    assert statuses == {
+        "a": "succeeded",
+        "bad": "failed",
+        "c": "cancelled",
+        "d": "cancelled",
+        "e": "succeeded",
+    }
+    assert report.succeeded is False
+    assert "bad failed" in report.outcomes["bad"].error
+    assert report.outcomes["c"].started is None
+
+
+@pytest.mark.integration
+@pytest.mark.domain
+def test_executor_reports_per_node_timing():
+    """
+    Invariant:
+    Each executed node reports start, finish and duration; the
+    makespan covers every node.
+    """
+
+    graph = workload_graph(PAIR, "sleep", seconds=0.01)
+
+    report = TaskGraphExecutor(HANDLERS, max_workers=2).run(graph)
+
+    a = report.outcomes["a"]
+    b = report.outcomes["b"]
+    assert a.duration == pytest.approx(a.finished - a.started)
+    assert a.duration >= 0.01
+    assert b.started >= a.finished
+    assert report.makespan >= a.duration + b.duration
+
+
+@pytest.mark.integration
+@pytest.mark.domain
+def test_executor_rejects_invalid_configuration():
+    """
+    Invariant:
+    Invalid pools, worker counts, unknown node kinds and cyclic graphs
+    raise ValueError before any handler runs.
+    """
+
+    with pytest.raises(ValueError):
+        TaskGraphExecutor(HANDLERS, max_workers=2, pool="fiber")
+
+    with pytest.raises(ValueError):
+        TaskGraphExecutor(HANDLERS, max_workers=0)
+
+    calls = []
+
+    def recording(node):
+        calls.append(node.id)
+
+    executor = TaskGraphExecutor({"sleep": recording}, max_workers=2)
+
+    with pytest.raises(ValueError):
+        executor.run(workload_graph(PAIR, "sleep", kinds={"b": "unknown"}, seconds=0.01))
+
+    cycle = GraphShape("cycle", ("a", "b"), (("a", "b"), ("b", "a")))
+    with pytest.raises(ValueError):
+        executor.run(workload_graph(cycle, "sleep", seconds=0.01))
+
+    assert calls == []
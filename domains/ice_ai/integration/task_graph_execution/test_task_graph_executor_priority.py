@@ -0,0 +1,36 @@
+import pytest
+
+from ice_ai.reasoning.executor import TaskGraphExecutor
+
+from tooling.helpers.task_graph_shapes import GraphShape
+from tooling.helpers.task_graph_workloads import HANDLERS, workload_graph
+
+
+UNIT = 0.1
+
+
+@pytest.mark.integration
+@pytest.mark.domain
+def test_executor_schedules_critical_path_first_when_workers_are_limited():
+    """
+    Invariant:
+    When ready nodes outnumber workers, the executor starts them in
+    TaskGraph.priority_order(). A long chain then overlaps with the
+    independent work instead of waiting behind it.
+
+    Six independent nodes are inserted before a four-node chain, with
+    two workers. Insertion order would run the independent nodes
+    first: 7 units. Critical-path-first reaches the optimum: 5 units.
+    """
+
+    independent = tuple(f"i{idx}" for idx in range(6))
+    chain = tuple(f"c{idx}" for idx in range(4))
+    edges = tuple(zip(chain, chain[1:]))
+    shape = GraphShape("chain_after_independent", independent + chain, edges)
+    graph = workload_graph(shape, "sleep", seconds=UNIT, estimated_cost=UNIT)
+
+    report = TaskGraphExecutor(HANDLERS, max_workers=2).run(graph)
+
+    assert report.succeeded is True
+    assert report.outcomes["c0"].started < report.outcomes["i0"].finished
+    assert report.makespan < 6 * UNIT
@@ -0,0 +1,69 @@
+"""
+Speedup tests for TaskGraphExecutor.
+
+Independent nodes must turn into parallel throughput: with W workers,
+a graph of independent nodes runs close to W times faster than with
+one worker. Speedup is measured against the same executor and pool
+with max_workers=1, so pool start-up cost is on both sides.
+"""
+
+import os
+
+import pytest
+
+from ice_ai.reasoning.executor import TaskGraphExecutor
+
+from tooling.helpers.task_graph_shapes import GraphShape, node_ids
+from tooling.helpers.task_graph_workloads import HANDLERS, workload_graph
+
+
+# Fraction of the ideal speedup the executor must reach.
+MIN_EFFICIENCY = 0.7
+
+TASKS_PER_WORKER = 4
+
+
+def independent(size):
+    return GraphShape("independent", node_ids(size), ())
+
+
+def speedup(graph, workers, pool):
+    serial = TaskGraphExecutor(HANDLERS, max_workers=1, pool=pool).run(graph)
+    parallel = TaskGraphExecutor(HANDLERS, max_workers=workers, pool=pool).run(graph)
+    assert serial.succeeded is True
+    assert parallel.succeeded is True
+    return serial.makespan / parallel.makespan
+
+
+@pytest.mark.integration
+@pytest.mark.domain
+def test_executor_speedup_on_sleep_bound_nodes_is_near_linear():
+    """
+    Invariant:
+    Sleep-bound nodes on a thread pool scale with max_workers.
+    """
+
+    workers = 4
+    graph = workload_graph(independent(workers * TASKS_PER_WORKER), "sleep", seconds=0.05)
+
+    assert speedup(graph, workers, "thread") >= MIN_EFFICIENCY * workers
+
+
+@pytest.mark.integration
+@pytest.mark.domain
+@pytest.mark.slow
+def test_executor_speedup_on_cpu_bound_nodes_is_near_linear():
+    """
+    Invariant:
+    CPU-bound nodes on a process pool scale with max_workers,
+    up to the number of CPUs.
+    """
+
+    cpus = os.cpu_count() or 1
+    if cpus < 2:
+        pytest.skip("CPU-bound speedup needs at least 2 CPUs")
+
+    workers = min(cpus, 4)
+    graph = workload_graph(independent(workers * TASKS_PER_WORKER), "cpu", iterations=2_000_000)
+
+    assert speedup(graph, workers, "process") >= MIN_EFFICIENCY * workers
@@ -0,0 +1,150 @@
+import random
+
+import pytest
+
+from ice_ai.llm.scoring import (
+    CognitiveScore,
+    ScoringProfile,
+    SCORING_PROFILES,
+    score_batch,
+)
+
+from tooling.helpers.complexity import best_time
+
+
+# The batched scorer is backed by NumPy, an optional dependency of ice_ai.
+np = pytest.importorskip("numpy")
+
+
+def random_scores(size, seed=0):
+    rng = random.Random(seed)
+    return [
+        CognitiveScore(
+            clarity=rng.random(),
+            coherence=rng.random(),
+            usefulness=rng.random(),
+            confidence=rng.random(),
+            correctness=rng.random(),
+        )
+        for _ in range(size)
+    ]
+
+
+PROFILES = [
+    *SCORING_PROFILES.values(),
+    ScoringProfile(name="unknown", weights={"clarity": 2.0, "nonexistent": 100.0}),
+    ScoringProfile(name="only_unknown", weights={"nonexistent": 1.0}),
+    ScoringProfile(name="empty", weights={}),
+]
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — SEMANTICS
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_score_batch_returns_scores_by_profiles_matrix():
+    """
+    Invariant:
+    score_batch() returns a float (N x P) array: one row per score,
+    one column per profile, in input order.
+    """
+
+    scores = random_scores(7)
+
+    result = score_batch(scores, PROFILES)
+
+    assert isinstance(result, np.ndarray)
+    assert result.shape == (7, len(PROFILES))
+    assert result.dtype == np.float64
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_score_batch_matches_profile_score_on_every_entry():
+    """
+    Invariant:
+    Every entry equals ScoringProfile.score() for its score and
+    profile, including unknown weights and profiles without valid
+    weights.
+    """
+
+    scores = random_scores(200)
+
+    result = score_batch(scores, PROFILES)
+
+    for row, score in enumerate(scores):
+        for column, profile in enumerate(PROFILES):
+            assert result[row, column] == pytest.approx(profile.score(score))
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_score_batch_profiles_without_valid_weights_score_zero():
+    """
+    Invariant:
+    A profile with no valid weight scores exactly 0.0, without
+    dividing by zero.
+    """
+
+    profiles = [
+        ScoringProfile(name="empty", weights={}),
+        ScoringProfile(name="only_unknown", weights={"nonexistent": 1.0}),
+    ]
+
+    with np.errstate(all="raise"):
+        result = score_batch(random_scores(5), profiles)
+
+    assert (result == 0.0).all()
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_score_batch_of_empty_inputs_keeps_shape():
+    """
+    Invariant:
+    No scores or no profiles produce an empty array of the right shape.
+    """
+
+    assert score_batch([], PROFILES).shape == (0, len(PROFILES))
+    assert score_batch(random_scores(3), []).shape == (3, 0)
+
+
+# ---------------------------------------------------------------------
+# PERFORMANCE
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.benchmark
+def test_score_batch_throughput_does_not_regress(benchmark):
+    """
+    Invariant:
+    Scoring 10^4 candidates against every registry profile keeps its
+    recorded throughput.
+    """
+
+    scores = random_scores(10_000)
+    profiles = list(SCORING_PROFILES.values())
+
+    result = benchmark(score_batch, scores, profiles)
+
+    assert result.shape == (10_000, len(profiles))
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_score_batch_is_faster_than_scoring_one_by_one():
+    """
+    Invariant:
+    The batched scorer beats calling profile.score() per pair.
+    """
+
+    scores = random_scores(10_000)
+    profiles = list(SCORING_PROFILES.values())
+
+    def one_by_one():
+        return [[profile.score(score) for profile in profiles] for score in scores]
+
+    assert best_time(lambda: score_batch(scores, profiles)) < best_time(one_by_one)
@@ -0,0 +1,237 @@
+import random
+
+import pytest
+
+from ice_ai.llm.scoring import (
+    CognitiveScore,
+    CognitiveScoreBatch,
+    ScoringProfile,
+    SCORING_PROFILES,
+)
+
+from tooling.helpers.complexity import peak_memory
+
+
+# The columnar batch is backed by NumPy, an optional dependency of ice_ai.
+np = pytest.importorskip("numpy")
+
+
+DIMENSIONS = ("clarity", "coherence", "usefulness", "confidence", "correctness")
+
+# A list of CognitiveScore objects must cost at least this many times
+# the columnar batch holding the same scores.
+MIN_MEMORY_REDUCTION = 4
+
+
+def random_scores(size, seed=0):
+    rng = random.Random(seed)
+    return [
+        CognitiveScore(
+            clarity=rng.random(),
+            coherence=rng.random(),
+            usefulness=rng.random(),
+            confidence=rng.random(),
+            correctness=rng.random(),
+            notes=f"candidate {idx}" if idx % 3 == 0 else "",
+        )
+        for idx in range(size)
+    ]
+
+
+def random_columns(size, seed=0):
+    rng = np.random.default_rng(seed)
+    return {name: rng.random(size) for name in DIMENSIONS}
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — CONVERSION
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_cognitive_score_batch_round_trip_is_lossless():
+    """
+    Invariant:
+    from_scores() followed by to_scores() returns equal CognitiveScore
+    objects, notes included, in input order.
+    """
+
+    scores = random_scores(100)
+
+    batch = CognitiveScoreBatch.from_scores(scores)
+
+    assert len(batch) == 100
+    assert batch.to_scores() == scores
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_cognitive_score_batch_from_columns_builds_scores_without_notes():
+    """
+    Invariant:
+    from_columns() builds a batch from one array per dimension,
+    without per-item objects; notes keep their CognitiveScore default.
+    """
+
+    columns = random_columns(10)
+
+    batch = CognitiveScoreBatch.from_columns(**columns)
+
+    assert len(batch) == 10
+    assert batch.to_scores()[0] == CognitiveScore(
+        **{name: float(columns[name][0]) for name in DIMENSIONS}
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_cognitive_score_batch_rejects_columns_of_different_lengths():
+    """
+    Invariant:
+    Every dimension must hold one value per score.
+    """
+
+    columns = random_columns(10)
+    columns["clarity"] = columns["clarity"][:5]
+
+    with pytest.raises(ValueError):
+        CognitiveScoreBatch.from_columns(**columns)
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — SCORING
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_cognitive_score_batch_overall_matches_cognitive_score():
+    """
+    Invariant:
+    overall() returns CognitiveScore.overall() for every score.
+    """
+
+    scores = random_scores(200)
+
+    overall = CognitiveScoreBatch.from_scores(scores).overall()
+
+    assert overall.shape == (200,)
+    assert list(overall) == pytest.approx([score.overall() for score in scores])
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.parametrize(
+    "profile",
+    [
+        *SCORING_PROFILES.values(),
+        ScoringProfile(name="unknown", weights={"clarity": 1.0, "nonexistent": 100.0}),
+        ScoringProfile(name="empty", weights={}),
+    ],
+    ids=lambda profile: profile.name,
+)
+def test_cognitive_score_batch_score_matches_profile(profile):
+    """
+    Invariant:
+    score(profile) returns profile.score() for every score, with the
+    same handling of unknown and missing weights.
+    """
+
+    scores = random_scores(200)
+
+    result = CognitiveScoreBatch.from_scores(scores).score(profile)
+
+    assert result.shape == (200,)
+    assert list(result) == pytest.approx([profile.score(score) for score in scores])
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — TOP-K
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.parametrize("profile", [None, SCORING_PROFILES["planning"]], ids=["overall", "planning"])
+def test_cognitive_score_batch_top_k_returns_best_indices_in_order(profile):
+    """
+    Invariant:
+    top_k(k, profile) returns the indices of the k best scores, best
+    first; without a profile, scores rank by overall().
+    """
+
+    scores = random_scores(1000)
+    batch = CognitiveScoreBatch.from_scores(scores)
+    values = batch.overall() if profile is None else batch.score(profile)
+
+    top = batch.top_k(10, profile)
+
+    expected = sorted(range(len(scores)), key=lambda idx: values[idx], reverse=True)[:10]
+    assert list(top) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_cognitive_score_batch_top_k_bounds():
+    """
+    Invariant:
+    k larger than the batch returns every index; k=0 returns none;
+    negative k raises ValueError.
+    """
+
+    batch = CognitiveScoreBatch.from_scores(random_scores(5))
+
+    assert sorted(batch.top_k(10)) == [0, 1, 2, 3, 4]
+    assert list(batch.top_k(0)) == []
+
+    with pytest.raises(ValueError):
+        batch.top_k(-1)
+
+
+# ---------------------------------------------------------------------
+# PERFORMANCE
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_cognitive_score_batch_memory_is_a_fraction_of_score_objects():
+    """
+    Invariant:
+    A columnar batch holds scores in contiguous float arrays: building
+    it from CognitiveScore objects costs at least MIN_MEMORY_REDUCTION
+    times less than the objects themselves.
+    """
+
+    size = 100_000
+    columns = random_columns(size)
+
+    def build_objects():
+        return [
+            CognitiveScore(**{name: float(columns[name][idx]) for name in DIMENSIONS})
+            for idx in range(size)
+        ]
+
+    # from_columns() may keep the input arrays as is, which would measure
+    # nothing: convert the objects instead.
+    scores, objects_peak = peak_memory(build_objects)
+    batch, batch_peak = peak_memory(lambda: CognitiveScoreBatch.from_scores(scores))
+
+    assert len(batch) == size
+    assert objects_peak / batch_peak >= MIN_MEMORY_REDUCTION, (
+        f"objects {objects_peak / size:.0f} B/score, batch {batch_peak / size:.0f} B/score"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.benchmark
+def test_cognitive_score_batch_top_k_throughput_does_not_regress(benchmark):
+    """
+    Invariant:
+    Ranking 10^5 candidates against a profile keeps its recorded
+    throughput.
+    """
+
+    batch = CognitiveScoreBatch.from_columns(**random_columns(100_000))
+
+    top = benchmark(batch.top_k, 100, SCORING_PROFILES["default"])
+
+    assert len(top) == 100
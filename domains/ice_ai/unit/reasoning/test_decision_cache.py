@@ -0,0 +1,217 @@
+import itertools
+
+import pytest
+
+from ice_ai.reasoning.decision import DecisionContext, DefaultDecisionPolicy
+from ice_ai.reasoning.routing import Intent, RoutingDecision
+
+
+def routing(intent=Intent.ANALYZE, confidence=0.8, payload=None, roles=("analyzer",)):
+    return RoutingDecision(
+        intent=intent,
+        reason="test",
+        confidence=confidence,
+        payload={"data": "x"} if payload is None else payload,
+        suggested_roles=list(roles),
+    )
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — EQUIVALENCE
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_cached_policy_decides_like_uncached_policy():
+    """
+    Invariant:
+    Caching is transparent: for every routing and context, a cached
+    policy returns a decision equal to the uncached one, on misses
+    and on hits.
+    """
+
+    plain = DefaultDecisionPolicy()
+    cached = DefaultDecisionPolicy(cache_size=64)
+
+    cases = list(
+        itertools.product(
+            Intent,
+            (0.1, 0.5, 0.8, 0.81, 1.0),
+            ("idle", "executing"),
+            ({"data": "x"}, {}),
+        )
+    )
+
+    for _ in range(2):
+        for intent, confidence, state, payload in cases:
+            route = routing(intent=intent, confidence=confidence, payload=payload)
+            context = DecisionContext(lifecycle_state=state)
+            assert cached.decide(routing=route, context=context) == plain.decide(
+                routing=route, context=context
+            )
+
+    assert cached.cache_info().hits > 0
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_cached_policy_keeps_exact_confidence():
+    """
+    Invariant:
+    Confidences in the same bucket share policy logic, but each
+    decision carries the exact confidence of its routing.
+    """
+
+    policy = DefaultDecisionPolicy(cache_size=8)
+    context = DecisionContext(lifecycle_state="idle")
+
+    first = policy.decide(routing=routing(confidence=0.8), context=context)
+    second = policy.decide(routing=routing(confidence=0.81), context=context)
+
+    assert first.confidence == 0.8
+    assert second.confidence == 0.81
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_cached_policy_decisions_do_not_share_meta():
+    """
+    Invariant:
+    Mutating the meta of a returned decision never leaks into later
+    decisions served from the cache.
+    """
+
+    policy = DefaultDecisionPolicy(cache_size=8)
+    context = DecisionContext(lifecycle_state="idle")
+
+    first = policy.decide(routing=routing(), context=context)
+    first.meta["payload"]["data"] = "mutated"
+    first.meta["suggested_roles"].append("intruder")
+
+    second = policy.decide(routing=routing(), context=context)
+
+    assert second.meta["payload"] == {"data": "x"}
+    assert second.meta["suggested_roles"] == ["analyzer"]
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — CACHE ACCOUNTING
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_policy_cache_is_disabled_by_default():
+    """
+    Invariant:
+    Without cache_size, nothing is cached or counted.
+    """
+
+    policy = DefaultDecisionPolicy()
+    context = DecisionContext(lifecycle_state="idle")
+
+    for _ in range(3):
+        policy.decide(routing=routing(), context=context)
+
+    info = policy.cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (0, 0, 0, 0)
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_policy_cache_counts_hits_and_misses():
+    """
+    Invariant:
+    A repeated routing and context is a hit; a new one is a miss.
+    """
+
+    policy = DefaultDecisionPolicy(cache_size=8)
+    idle = DecisionContext(lifecycle_state="idle")
+    executing = DecisionContext(lifecycle_state="executing")
+
+    policy.decide(routing=routing(), context=idle)
+    policy.decide(routing=routing(), context=idle)
+    policy.decide(routing=routing(), context=executing)
+    policy.decide(routing=routing(payload={"data": "y"}), context=idle)
+
+    info = policy.cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 3, 8, 3)
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_policy_cache_is_bounded_and_evicts_least_recently_used():
+    """
+    Invariant:
+    The cache never holds more than cache_size entries and evicts
+    the least recently used one.
+    """
+
+    policy = DefaultDecisionPolicy(cache_size=2)
+    context = DecisionContext(lifecycle_state="idle")
+    a, b, c = (routing(payload={"data": name}) for name in "abc")
+
+    policy.decide(routing=a, context=context)
+    policy.decide(routing=b, context=context)
+    policy.decide(routing=a, context=context)  # hit: b is now oldest
+    policy.decide(routing=c, context=context)  # evicts b
+    policy.decide(routing=a, context=context)  # hit
+    policy.decide(routing=b, context=context)  # miss
+
+    info = policy.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 4, 2)
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_policy_cache_bypasses_unhashable_payloads():
+    """
+    Invariant:
+    A payload that cannot be hashed is decided without the cache and
+    is neither a hit nor a miss.
+    """
+
+    policy = DefaultDecisionPolicy(cache_size=8)
+    context = DecisionContext(lifecycle_state="idle")
+    route = routing(payload={"items": [1, 2]})
+
+    first = policy.decide(routing=route, context=context)
+    second = policy.decide(routing=route, context=context)
+
+    assert first == second == DefaultDecisionPolicy().decide(routing=route, context=context)
+    info = policy.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_policy_rejects_negative_cache_size():
+    """
+    Invariant:
+    cache_size must be >= 0 (0 disables the cache).
+    """
+
+    with pytest.raises(ValueError):
+        DefaultDecisionPolicy(cache_size=-1)
+
+
+# ---------------------------------------------------------------------
+# PERFORMANCE
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.benchmark
+def test_cached_policy_hit_latency_does_not_regress(benchmark):
+    """
+    Invariant:
+    A cache hit keeps its recorded latency.
+    """
+
+    policy = DefaultDecisionPolicy(cache_size=8)
+    context = DecisionContext(lifecycle_state="idle")
+    route = routing()
+
+    decision = benchmark(policy.decide, routing=route, context=context)
+
+    assert decision.proceed is True
+    assert policy.cache_info().hits > 0
@@ -0,0 +1,133 @@
+import copy
+import types
+
+import pytest
+
+from ice_ai.reasoning.planner import Planner, PlanStep
+
+from tooling.helpers.complexity import peak_memory
+
+
+MIXED_ACTIONS = [
+    {
+        "title": "Scan files",
+        "description": "Scan all source files",
+        "type": "analyze",
+        "agent_hint": "scanner",
+        "payload": {"path": "src/"},
+    },
+    "Generate report",
+    {"description": "Step C"},
+]
+
+
+def generated_actions(size, consumed=None):
+    for idx in range(size):
+        if consumed is not None:
+            consumed.append(idx)
+        yield {"description": f"Step {idx}", "payload": {"index": idx}}
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.parametrize("raw_actions", [MIXED_ACTIONS, None, []], ids=["mixed", "none", "empty"])
+def test_planner_iter_plan_yields_build_plan_steps(raw_actions):
+    """
+    Invariant:
+    iter_plan() yields exactly the steps build_plan() returns,
+    fallback plan included.
+    """
+
+    streamed = Planner.iter_plan(goal="Scan project", raw_actions=raw_actions)
+
+    assert isinstance(streamed, types.GeneratorType)
+    assert list(streamed) == Planner.build_plan(goal="Scan project", raw_actions=raw_actions)
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_planner_iter_plan_is_lazy():
+    """
+    Invariant:
+    iter_plan() normalizes an action only when its step is consumed,
+    so the first step can be dispatched before the last is parsed.
+    """
+
+    consumed = []
+    streamed = Planner.iter_plan(goal="Refactor", raw_actions=generated_actions(1000, consumed))
+
+    assert consumed == []
+
+    first = next(streamed)
+    assert isinstance(first, PlanStep)
+    assert first.id == "step-1"
+    assert consumed == [0]
+
+    second = next(streamed)
+    assert second.id == "step-2"
+    assert consumed == [0, 1]
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_planner_iter_plan_accepts_iterators_and_keeps_ids_deterministic():
+    """
+    Invariant:
+    Any iterable of actions is accepted; step ids are step-1..step-N
+    in input order.
+    """
+
+    plan = list(Planner.iter_plan(goal="Refactor", raw_actions=generated_actions(5)))
+
+    assert [step.id for step in plan] == [f"step-{idx}" for idx in range(1, 6)]
+    assert [step.payload for step in plan] == [{"index": idx} for idx in range(5)]
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_planner_iter_plan_falls_back_on_exhausted_iterator():
+    """
+    Invariant:
+    An iterator that yields no action produces the fallback plan,
+    like an empty list.
+    """
+
+    plan = list(Planner.iter_plan(goal="Analyze the project structure", raw_actions=iter(())))
+
+    assert plan == Planner.build_plan(goal="Analyze the project structure", raw_actions=None)
+    assert "Analyze the project structure" in plan[0].payload.get("goal", "")
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_planner_iter_plan_does_not_mutate_input():
+    """
+    Invariant:
+    Streaming never mutates the raw actions or shares their payloads.
+    """
+
+    raw_actions = copy.deepcopy(MIXED_ACTIONS)
+
+    plan = list(Planner.iter_plan(goal="Scan project", raw_actions=raw_actions))
+
+    assert raw_actions == MIXED_ACTIONS
+    assert plan[0].payload is not raw_actions[0]["payload"]
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_planner_iter_plan_memory_does_not_grow_with_action_count():
+    """
+    Invariant:
+    Consuming a streamed plan one step at a time keeps peak memory
+    constant: nothing is buffered.
+    """
+
+    def consume(size):
+        for _ in Planner.iter_plan(goal="Refactor", raw_actions=generated_actions(size)):
+            pass
+
+    _, small = peak_memory(lambda: consume(1_000))
+    _, large = peak_memory(lambda: consume(100_000))
+
+    assert large <= 2 * small, f"peak grew from {small} B to {large} B"
@@ -0,0 +1,53 @@
+import pytest
+
+from ice_ai.reasoning.routing import Router
+from ice_ai.reasoning.task_graph import TaskGraph, TaskNode
+
+
+# Benchmarks are gated against governance/regression/benchmarks.json
+# when run with --ice-benchmark-compare.
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.benchmark
+def test_router_route_latency_does_not_regress(benchmark):
+    """
+    Invariant:
+    Router.route is on the path of every LLM turn and must not
+    become significantly slower than its recorded baseline.
+    """
+
+    llm_output = {
+        "actions": [
+            {"title": "Step 1", "description": "Analyze"},
+            {"title": "Step 2", "description": "Refactor"},
+        ]
+    }
+
+    decision = benchmark(
+        Router.route,
+        user_query="Refactor project",
+        llm_output=llm_output,
+    )
+
+    assert decision.payload["goal"] == "Refactor project"
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.benchmark
+def test_task_graph_is_valid_dag_latency_does_not_regress(benchmark):
+    """
+    Invariant:
+    TaskGraph.is_valid_dag on a 1000-node plan must not become
+    significantly slower than its recorded baseline.
+    """
+
+    graph = TaskGraph()
+    for idx in range(1000):
+        graph.add_node(TaskNode(id=f"n{idx}", kind="step", description=f"Step {idx}"))
+    for idx in range(1, 1000):
+        graph.add_dependency(f"n{idx - 1}", f"n{idx}")
+
+    assert benchmark(graph.is_valid_dag) is True
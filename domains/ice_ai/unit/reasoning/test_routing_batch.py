@@ -0,0 +1,149 @@
+import pytest
+
+from ice_ai.reasoning.routing import Router
+
+from tooling.helpers.complexity import best_time
+
+
+# Timing noise allowed when comparing batch routing to a route() loop.
+TOLERANCE = 1.1
+
+
+BATCH = [
+    ("Refactor project", {"actions": [{"title": "Step 1", "description": "Analyze"}]}, None),
+    ("Check correctness", {"issues": [{"type": "error", "message": "Wrong"}]}, None),
+    ("Explain this code", {"analysis": "This function does X because Y"}, None),
+    ("Hello", {"answer": "Hi"}, None),
+    ("Do something complex", {"actions": ["fake"]}, "plan"),
+    ("Test", {"answer": "fallback"}, "unknown_mode"),
+]
+
+
+def unzip(batch):
+    queries, outputs, modes = zip(*batch)
+    return list(queries), list(outputs), list(modes)
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_router_route_many_equals_per_item_routing():
+    """
+    Invariant:
+    route_many() returns, in order, the decisions route() returns
+    for each (query, output, mode).
+    """
+
+    queries, outputs, modes = unzip(BATCH * 3)
+
+    decisions = Router.route_many(queries, outputs, modes)
+
+    assert decisions == [
+        Router.route(user_query=query, llm_output=output, mode=mode)
+        for query, output, mode in zip(queries, outputs, modes)
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_router_route_many_without_modes_uses_heuristics():
+    """
+    Invariant:
+    modes=None routes every item without an explicit mode.
+    """
+
+    queries, outputs, _ = unzip(BATCH)
+
+    decisions = Router.route_many(queries, outputs)
+
+    assert decisions == [
+        Router.route(user_query=query, llm_output=output)
+        for query, output in zip(queries, outputs)
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_router_route_many_of_empty_batch_is_empty():
+    """
+    Invariant:
+    An empty batch routes to an empty list.
+    """
+
+    assert Router.route_many([], []) == []
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.parametrize(
+    "queries, outputs, modes",
+    [
+        (["a", "b"], [{}], None),
+        (["a"], [{}, {}], None),
+        (["a"], [{}], [None, "plan"]),
+    ],
+)
+def test_router_route_many_rejects_length_mismatch(queries, outputs, modes):
+    """
+    Invariant:
+    queries, outputs and modes must have the same length.
+    """
+
+    with pytest.raises(ValueError):
+        Router.route_many(queries, outputs, modes)
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_router_route_many_shares_suggested_roles_per_intent():
+    """
+    Invariant:
+    Decisions with the same intent share one suggested_roles list
+    instead of rebuilding it per item.
+    """
+
+    queries, outputs, modes = unzip(BATCH * 3)
+
+    decisions = Router.route_many(queries, outputs, modes)
+
+    by_intent = {}
+    for decision in decisions:
+        roles = by_intent.setdefault(decision.intent, decision.suggested_roles)
+        assert decision.suggested_roles is roles
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.benchmark
+def test_router_route_many_throughput_does_not_regress(benchmark):
+    """
+    Invariant:
+    Batch routing of 1000 recorded turns keeps its recorded throughput.
+    """
+
+    queries, outputs, modes = unzip(BATCH * 167)
+
+    decisions = benchmark(Router.route_many, queries, outputs, modes)
+
+    assert len(decisions) == len(queries)
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.slow
+def test_router_route_many_is_not_slower_than_a_route_loop():
+    """
+    Invariant:
+    Batch routing never costs more per item than calling route()
+    in a loop, within TOLERANCE.
+    """
+
+    queries, outputs, modes = unzip(BATCH * 1000)
+    items = list(zip(queries, outputs, modes))
+
+    def loop():
+        for query, output, mode in items:
+            Router.route(user_query=query, llm_output=output, mode=mode)
+
+    batch = best_time(lambda: Router.route_many(queries, outputs, modes))
+
+    assert batch <= TOLERANCE * best_time(loop)
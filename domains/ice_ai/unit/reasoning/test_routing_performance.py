@@ -0,0 +1,92 @@
+import pytest
+
+from ice_ai.reasoning.routing import Intent, Router
+
+from tooling.helpers.complexity import assert_flat, best_time
+
+
+# Benchmarks are gated against governance/regression/benchmarks.json
+# when run with --ice-benchmark-compare.
+
+ROUTES = {
+    "plan": (
+        {"actions": [{"title": "Step 1", "description": "Analyze"}]},
+        None,
+        Intent.PLAN,
+    ),
+    "validate": (
+        {"issues": [{"type": "error", "message": "Something is wrong"}]},
+        None,
+        Intent.VALIDATE,
+    ),
+    "analyze": (
+        {"analysis": "This function does X because Y"},
+        None,
+        Intent.ANALYZE,
+    ),
+    "respond": (
+        {"answer": "Hi"},
+        None,
+        Intent.RESPOND,
+    ),
+    "explicit_mode": (
+        {"actions": ["fake"]},
+        "plan",
+        Intent.PLAN,
+    ),
+    "unknown_mode": (
+        {"answer": "fallback"},
+        "unknown_mode",
+        Intent.RESPOND,
+    ),
+}
+
+# Unrelated keys in an LLM output, e.g. tool traces and usage metadata.
+NOISE_SIZES = (10, 10_000)
+
+CALLS = 2000
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.benchmark
+@pytest.mark.parametrize("route", sorted(ROUTES))
+def test_router_route_throughput_does_not_regress(benchmark, route):
+    """
+    Invariant:
+    Each routing branch keeps its recorded throughput.
+    """
+
+    llm_output, mode, intent = ROUTES[route]
+
+    decision = benchmark(Router.route, user_query="Query", llm_output=llm_output, mode=mode)
+
+    assert decision.intent is intent
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.slow
+@pytest.mark.parametrize("route", ["plan", "validate", "explicit_mode"])
+def test_router_route_cost_does_not_grow_with_unrelated_keys(route):
+    """
+    Invariant:
+    Heuristics look up a fixed set of keys: routing never scans the
+    LLM output, so unrelated keys do not slow it down.
+    """
+
+    llm_output, mode, intent = ROUTES[route]
+    timings = []
+
+    for size in NOISE_SIZES:
+        noisy = {f"trace_{idx}": idx for idx in range(size)}
+        noisy.update(llm_output)
+        assert Router.route(user_query="Query", llm_output=noisy, mode=mode).intent is intent
+
+        def route_many():
+            for _ in range(CALLS):
+                Router.route(user_query="Query", llm_output=noisy, mode=mode)
+
+        timings.append(best_time(route_many) / CALLS)
+
+    assert_flat(f"Router.route ({route})", NOISE_SIZES, timings)
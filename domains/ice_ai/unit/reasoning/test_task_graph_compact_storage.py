@@ -0,0 +1,132 @@
+import pytest
+
+from ice_ai.reasoning.task_graph import TaskGraph, TaskNode
+
+from tooling.helpers.task_graph_shapes import build_graph, random_dag
+
+
+STORAGES = ["object", "compact"]
+
+CAPABILITIES = ("analysis", "planning", "coding", "review")
+
+
+def make_node(idx, node_id):
+    return TaskNode(
+        id=node_id,
+        kind=("plan", "analyze", "execute")[idx % 3],
+        description=f"step {node_id}",
+        required_capabilities={CAPABILITIES[idx % 4], CAPABILITIES[(idx + 1) % 4]},
+        suggested_agent=None if idx % 2 else "analyzer",
+        metadata={"estimated_cost": 1 + idx % 5} if idx % 3 else {},
+    )
+
+
+@pytest.fixture(scope="module")
+def graphs():
+    shape = random_dag(300, parents=3, window=20)
+    return shape, build_graph(shape, make_node), build_graph(shape, make_node, storage="compact")
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_compact_storage_answers_like_object_storage(graphs):
+    """
+    Invariant:
+    Compact storage is a representation change only: every query
+    returns the same value as the default object storage.
+    """
+
+    shape, reference, compact = graphs
+
+    for node_id in shape.ids:
+        assert compact.dependencies_of(node_id) == reference.dependencies_of(node_id)
+        assert compact.dependents_of(node_id) == reference.dependents_of(node_id)
+
+    assert compact.roots() == reference.roots()
+    assert compact.leaves() == reference.leaves()
+    assert compact.is_valid_dag() is reference.is_valid_dag() is True
+    assert list(compact.waves()) == list(reference.waves())
+    assert compact.priority_order() == reference.priority_order()
+    assert compact.to_dict() == reference.to_dict()
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_compact_storage_returns_equal_nodes(graphs):
+    """
+    Invariant:
+    get_node() on compact storage rebuilds an equal TaskNode,
+    capabilities and metadata included. Identity is not preserved.
+    """
+
+    shape, _, compact = graphs
+
+    for idx, node_id in enumerate(shape.ids):
+        assert compact.get_node(node_id) == make_node(idx, node_id)
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_compact_storage_nodes_are_detached():
+    """
+    Invariant:
+    Mutating a node returned by get_node() never changes the graph.
+    """
+
+    graph = TaskGraph(storage="compact")
+    graph.add_node(make_node(0, "a"))
+
+    node = graph.get_node("a")
+    node.required_capabilities.add("deploy")
+    node.metadata["estimated_cost"] = 99
+
+    assert graph.get_node("a") == make_node(0, "a")
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.parametrize("storage", STORAGES)
+def test_task_graph_storages_reject_the_same_errors(storage):
+    """
+    Invariant:
+    Both storages reject duplicate nodes and edges to unknown nodes.
+    """
+
+    graph = TaskGraph(storage=storage)
+    graph.add_node(make_node(0, "a"))
+
+    with pytest.raises(ValueError):
+        graph.add_node(make_node(1, "a"))
+
+    with pytest.raises(ValueError):
+        graph.add_dependency("a", "missing")
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.parametrize("storage", STORAGES)
+def test_task_graph_storages_detect_cycles(storage):
+    """
+    Invariant:
+    Cycle detection does not depend on the storage.
+    """
+
+    graph = TaskGraph(storage=storage)
+    graph.add_node(make_node(0, "a"))
+    graph.add_node(make_node(1, "b"))
+    graph.add_dependency("a", "b")
+    graph.add_dependency("b", "a")
+
+    assert graph.is_valid_dag() is False
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_rejects_unknown_storage():
+    """
+    Invariant:
+    Only "object" (default) and "compact" storages exist.
+    """
+
+    with pytest.raises(ValueError):
+        TaskGraph(storage="columnar")
@@ -0,0 +1,157 @@
+import pytest
+
+from ice_ai.reasoning.task_graph import TaskGraph, TaskNode
+
+from tooling.helpers.task_graph_shapes import GraphShape, build_graph
+
+
+def costed(costs):
+    """
+    Returns a build_graph() node factory with each node's estimated_cost.
+    """
+
+    def make_node(idx, node_id):
+        return TaskNode(
+            id=node_id,
+            kind="step",
+            description=node_id,
+            metadata={"estimated_cost": costs[node_id]},
+        )
+
+    return make_node
+
+
+# a(2) -> b(3) -> d(1)
+# a(2) -> c(1) -> d(1)
+# e(1)
+WEIGHTED = GraphShape(
+    "weighted",
+    ("a", "b", "c", "d", "e"),
+    (("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")),
+)
+WEIGHTS = {"a": 2, "b": 3, "c": 1, "d": 1, "e": 1}
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_critical_path_is_longest_cost_path():
+    """
+    Invariant:
+    critical_path() is the dependency path with the largest total
+    estimated_cost, from a root to a leaf.
+    """
+
+    graph = build_graph(WEIGHTED, costed(WEIGHTS))
+
+    assert graph.critical_path() == ["a", "b", "d"]
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_start_windows_and_slack():
+    """
+    Invariant:
+    start_windows() reports, per node, the earliest start given its
+    dependencies, the latest start that does not delay the critical
+    path, and the slack between them. Critical nodes have zero slack.
+    """
+
+    graph = build_graph(WEIGHTED, costed(WEIGHTS))
+
+    windows = graph.start_windows()
+
+    assert {node_id: window.earliest for node_id, window in windows.items()} == {
+        "a": 0, "b": 2, "c": 2, "d": 5, "e": 0,
+    }
+    assert {node_id: window.latest for node_id, window in windows.items()} == {
+        "a": 0, "b": 2, "c": 4, "d": 5, "e": 5,
+    }
+    assert {node_id: window.slack for node_id, window in windows.items()} == {
+        "a": 0, "b": 0, "c": 2, "d": 0, "e": 5,
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_priority_order_puts_critical_work_first():
+    """
+    Invariant:
+    priority_order() lists every node by decreasing remaining critical
+    path (the node's cost plus its longest path to a leaf), ties in
+    insertion order. With positive costs it is a topological order.
+    """
+
+    graph = build_graph(WEIGHTED, costed(WEIGHTS))
+
+    order = graph.priority_order()
+
+    assert order == ["a", "b", "c", "d", "e"]
+    position = {node_id: idx for idx, node_id in enumerate(order)}
+    for source, target in WEIGHTED.edges:
+        assert position[source] < position[target]
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_missing_cost_defaults_to_one():
+    """
+    Invariant:
+    Nodes without metadata["estimated_cost"] cost 1: an unweighted
+    graph's critical path is its longest chain.
+    """
+
+    graph = build_graph(
+        GraphShape("unweighted", ("a", "b", "c", "x"), (("a", "b"), ("b", "c"), ("x", "c")))
+    )
+
+    assert graph.critical_path() == ["a", "b", "c"]
+    assert graph.start_windows()["x"].slack == 1
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_critical_path_of_empty_graph_is_empty():
+    """
+    Invariant:
+    An empty graph has an empty critical path and priority order.
+    """
+
+    graph = TaskGraph()
+
+    assert graph.critical_path() == []
+    assert graph.start_windows() == {}
+    assert graph.priority_order() == []
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.parametrize("cost", [-1, "fast"])
+def test_task_graph_rejects_invalid_estimated_cost(cost):
+    """
+    Invariant:
+    estimated_cost must be a non-negative number.
+    """
+
+    graph = build_graph(GraphShape("single", ("a",), ()), costed({"a": cost}))
+
+    with pytest.raises(ValueError):
+        graph.critical_path()
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_critical_path_rejects_cyclic_graph():
+    """
+    Invariant:
+    Path lengths are undefined on a cyclic graph: ValueError.
+    """
+
+    graph = build_graph(
+        GraphShape("cycle", ("a", "b"), (("a", "b"), ("b", "a"))), costed({"a": 1, "b": 1})
+    )
+
+    with pytest.raises(ValueError):
+        graph.critical_path()
+
+    with pytest.raises(ValueError):
+        graph.priority_order()
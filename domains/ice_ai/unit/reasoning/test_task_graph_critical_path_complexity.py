@@ -0,0 +1,70 @@
+"""
+Unit tests for TaskGraph critical-path complexity.
+
+Critical-path analysis is one forward and one backward pass over a
+topological order. These tests guarantee that critical_path(),
+start_windows() and priority_order() cost O(V + E) on every shape.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from ice_ai.reasoning.task_graph import TaskNode
+
+from tooling.helpers.complexity import assert_near_linear, best_time
+from tooling.helpers.task_graph_shapes import SHAPES, build_graph
+
+
+# ============================================================
+# MARKERS
+# ============================================================
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.domain,
+    pytest.mark.slow,
+]
+
+
+SIZES = (10_000, 100_000)
+
+ANALYSES = ("critical_path", "start_windows", "priority_order")
+
+
+def costed_node(idx, node_id):
+    return TaskNode(
+        id=node_id,
+        kind="step",
+        description=node_id,
+        metadata={"estimated_cost": 1 + idx % 7},
+    )
+
+
+@pytest.fixture(scope="module", params=sorted(SHAPES))
+def shape_graphs(request):
+    """
+    One shape at every size, built once for all analyses: analyses
+    never mutate the graph.
+    """
+    shape = SHAPES[request.param]
+    return request.param, {size: build_graph(shape(size), costed_node) for size in SIZES}
+
+
+# ============================================================
+# COMPLEXITY
+# ============================================================
+
+@pytest.mark.parametrize("analysis", ANALYSES)
+def test_critical_path_analysis_scales_linearly(shape_graphs, analysis):
+    """
+    Invariant:
+    Each analysis is near-linear in the size of the graph.
+    """
+    shape, graphs = shape_graphs
+    timings = []
+    for size in SIZES:
+        graph = graphs[size]
+        timings.append(best_time(getattr(graph, analysis)))
+
+    assert_near_linear(f"{shape} {analysis}()", SIZES, timings)
@@ -0,0 +1,113 @@
+"""
+Unit tests for TaskGraph online cycle detection complexity.
+
+Cycles are detected when an edge is inserted, not by re-scanning the
+graph. These tests guarantee that:
+
+- is_valid_dag() is O(1)
+- rejecting cycles at insertion costs amortized sub-linear time per
+  edge, including insertion orders that defeat a search-per-edge
+  check, forward or backward
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from tooling.helpers.complexity import assert_flat, assert_near_linear, best_time
+from tooling.helpers.task_graph_shapes import GraphShape, build_graph, chain, node_ids
+
+
+# ============================================================
+# MARKERS
+# ============================================================
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.domain,
+    pytest.mark.slow,
+]
+
+
+QUERIES = 1000
+
+
+def reversed_chain(size):
+    """
+    A chain whose edges arrive from its end to its start: every new
+    edge lands in front of a long descendant path (worst case for a
+    forward search).
+    """
+    shape = chain(size)
+    return GraphShape("reversed_chain", shape.ids, tuple(reversed(shape.edges)))
+
+
+def crossed_chains(size):
+    """
+    Two chains a and b, then an edge from the end of a to every node
+    of b, in order. Each cross edge has a long ancestor path behind
+    its source and a long descendant path after its target, so both a
+    forward and a backward search-per-edge cost O(size) per edge.
+    Nodes of b are added first, against the final topological order.
+    """
+    half = size // 2
+    b, a = node_ids(size)[:half], node_ids(size)[half:]
+    edges = (
+        tuple(zip(a, a[1:]))
+        + tuple(zip(b, b[1:]))
+        + tuple((a[-1], target) for target in b)
+    )
+    return GraphShape("crossed_chains", b + a, edges)
+
+
+ADVERSARIAL = {
+    "reversed_chain": reversed_chain,
+    "crossed_chains": crossed_chains,
+}
+
+
+# ============================================================
+# COMPLEXITY
+# ============================================================
+
+def test_is_valid_dag_cost_is_independent_of_graph_size():
+    """
+    Invariant:
+    is_valid_dag() answers from state maintained at insertion.
+    """
+    sizes = (10_000, 100_000)
+    timings = []
+
+    for size in sizes:
+        graph = build_graph(chain(size))
+
+        def query():
+            for _ in range(QUERIES):
+                graph.is_valid_dag()
+
+        timings.append(best_time(query) / QUERIES)
+
+    assert_flat("is_valid_dag()", sizes, timings)
+
+
+@pytest.mark.parametrize("order", sorted(ADVERSARIAL))
+@pytest.mark.parametrize("reject_cycles", [False, True])
+def test_adversarial_edge_insertion_is_amortized_sub_linear(order, reject_cycles):
+    """
+    Invariant:
+    Insertion orders that defeat a search-per-edge cycle check,
+    forward or backward, stay near-linear overall in both cycle modes.
+    """
+    sizes = (1_000, 10_000)
+    timings = []
+
+    for size in sizes:
+        shape = ADVERSARIAL[order](size)
+
+        def insert():
+            graph = build_graph(shape, reject_cycles=reject_cycles)
+            assert graph.is_valid_dag() is True
+
+        timings.append(best_time(insert, repeat=1))
+
+    assert_near_linear(f"{order} edge insertion", sizes, timings)
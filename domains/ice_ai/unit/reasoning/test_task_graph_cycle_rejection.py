@@ -0,0 +1,111 @@
+import pytest
+
+from tooling.helpers.task_graph_shapes import GraphShape, build_graph
+
+
+def nodes(*node_ids):
+    """
+    Edgeless shape: each test adds its dependencies one by one.
+    """
+    return GraphShape("nodes", node_ids, ())
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_flags_cycle_at_insertion_by_default():
+    """
+    Invariant:
+    By default a cycle-closing edge is accepted, and the graph is
+    flagged invalid as soon as the edge is inserted.
+    """
+
+    graph = build_graph(nodes("a", "b", "c"))
+
+    graph.add_dependency("a", "b")
+    graph.add_dependency("b", "c")
+    assert graph.is_valid_dag() is True
+
+    graph.add_dependency("c", "a")  # cycle
+    assert graph.is_valid_dag() is False
+    assert graph.dependencies_of("a") == ["c"]
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_stays_invalid_after_more_edges_once_flagged():
+    """
+    Invariant:
+    A flagged cycle is never forgotten by later, acyclic insertions.
+    """
+
+    graph = build_graph(nodes("a", "b", "c"))
+
+    graph.add_dependency("a", "b")
+    graph.add_dependency("b", "a")  # cycle
+    graph.add_dependency("b", "c")
+
+    assert graph.is_valid_dag() is False
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_rejecting_mode_raises_on_cycle_closing_edge():
+    """
+    Invariant:
+    With reject_cycles=True, an edge closing a cycle raises ValueError
+    and leaves the graph unchanged.
+    """
+
+    graph = build_graph(nodes("a", "b", "c"), reject_cycles=True)
+
+    graph.add_dependency("a", "b")
+    graph.add_dependency("b", "c")
+
+    with pytest.raises(ValueError):
+        graph.add_dependency("c", "a")
+
+    assert graph.dependencies_of("a") == []
+    assert graph.dependents_of("c") == []
+    assert graph.roots() == ["a"]
+    assert graph.leaves() == ["c"]
+    assert graph.is_valid_dag() is True
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_rejecting_mode_raises_on_self_dependency():
+    """
+    Invariant:
+    A node depending on itself is the smallest cycle and is rejected.
+    """
+
+    graph = build_graph(nodes("a"), reject_cycles=True)
+
+    with pytest.raises(ValueError):
+        graph.add_dependency("a", "a")
+
+    assert graph.is_valid_dag() is True
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_rejecting_mode_accepts_edges_against_insertion_order():
+    """
+    Invariant:
+    Edges pointing from later to earlier inserted nodes are valid
+    as long as they close no cycle.
+    """
+
+    graph = build_graph(nodes("a", "b", "c", "d"), reject_cycles=True)
+
+    graph.add_dependency("d", "c")
+    graph.add_dependency("c", "b")
+    graph.add_dependency("b", "a")
+    graph.add_dependency("d", "a")
+
+    assert graph.is_valid_dag() is True
+    assert graph.roots() == ["d"]
+    assert graph.leaves() == ["a"]
+
+    with pytest.raises(ValueError):
+        graph.add_dependency("a", "d")
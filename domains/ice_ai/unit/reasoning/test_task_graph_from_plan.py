@@ -0,0 +1,128 @@
+import pytest
+
+from ice_ai.reasoning.planner import Planner
+from ice_ai.reasoning.task_graph import TaskGraph
+
+from tooling.helpers.task_graph_shapes import build_plan_graph
+
+
+def plan_of(size):
+    return Planner.build_plan(
+        goal="Refactor",
+        raw_actions=[
+            {
+                "title": f"Step {idx}",
+                "description": f"Do step {idx}",
+                "type": ("analyze", "execute")[idx % 2],
+                "agent_hint": "scanner" if idx % 3 else None,
+                "payload": {"index": idx},
+            }
+            for idx in range(size)
+        ],
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_from_plan_maps_plan_steps_to_nodes():
+    """
+    Invariant:
+    Each PlanStep becomes a TaskNode: id, type as kind, description,
+    agent_hint as suggested_agent; title and payload go to metadata.
+    """
+
+    step = plan_of(1)[0]
+
+    graph = TaskGraph.from_plan([step], [])
+
+    node = graph.get_node(step.id)
+    assert node.kind == step.type == "analyze"
+    assert node.description == step.description
+    assert node.suggested_agent == step.agent_hint
+    assert node.metadata == {"title": "Step 0", "payload": {"index": 0}}
+    assert node.required_capabilities == set()
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.parametrize("storage", ["object", "compact"])
+def test_task_graph_from_plan_equals_incremental_construction(storage):
+    """
+    Invariant:
+    from_plan() builds the same graph as add_node()/add_dependency()
+    in input order, in every storage.
+    """
+
+    steps = plan_of(50)
+    ids = [step.id for step in steps]
+    edges = [(ids[idx // 2], ids[idx]) for idx in range(1, len(ids))]
+
+    bulk = TaskGraph.from_plan(steps, edges, storage=storage)
+    reference = build_plan_graph(steps, edges, storage=storage)
+
+    assert bulk.to_dict() == reference.to_dict()
+    for node_id in ids:
+        assert bulk.dependencies_of(node_id) == reference.dependencies_of(node_id)
+        assert bulk.dependents_of(node_id) == reference.dependents_of(node_id)
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_from_plan_does_not_share_payloads():
+    """
+    Invariant:
+    Plan steps are not mutated, and node metadata does not alias
+    their payloads.
+    """
+
+    steps = plan_of(2)
+
+    graph = TaskGraph.from_plan(steps, [(steps[0].id, steps[1].id)])
+    graph.get_node(steps[0].id).metadata["payload"]["index"] = 99
+
+    assert steps[0].payload == {"index": 0}
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_from_plan_rejects_duplicate_step_ids():
+    """
+    Invariant:
+    Duplicate step ids raise ValueError, as add_node() would.
+    """
+
+    step = plan_of(1)[0]
+
+    with pytest.raises(ValueError):
+        TaskGraph.from_plan([step, step], [])
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.parametrize("edge", [("step-1", "missing"), ("missing", "step-1")])
+def test_task_graph_from_plan_rejects_unknown_edge_endpoints(edge):
+    """
+    Invariant:
+    Edges must connect steps of the plan.
+    """
+
+    with pytest.raises(ValueError):
+        TaskGraph.from_plan(plan_of(2), [edge])
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_from_plan_follows_cycle_mode():
+    """
+    Invariant:
+    A cyclic edge list flags the graph by default and raises ValueError
+    with reject_cycles=True.
+    """
+
+    steps = plan_of(2)
+    edges = [("step-1", "step-2"), ("step-2", "step-1")]
+
+    assert TaskGraph.from_plan(steps, edges).is_valid_dag() is False
+
+    with pytest.raises(ValueError):
+        TaskGraph.from_plan(steps, edges, reject_cycles=True)
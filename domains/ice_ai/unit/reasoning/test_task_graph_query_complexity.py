@@ -0,0 +1,155 @@
+"""
+Unit tests for TaskGraph query complexity.
+
+Schedulers poll TaskGraph readiness across large graphs.
+These tests guarantee that TaskGraph keeps bidirectional adjacency
+indexes and maintains roots and leaves incrementally:
+
+- dependencies_of() / dependents_of() cost O(degree)
+- roots() / leaves() cost O(size of the result), not O(graph)
+
+Query results are snapshots: mutating them never mutates the graph.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from ice_ai.reasoning.task_graph import TaskGraph, TaskNode
+
+from tooling.helpers.complexity import assert_flat, best_time
+from tooling.helpers.task_graph_shapes import build_graph, chain
+
+
+# ============================================================
+# MARKERS
+# ============================================================
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.domain,
+]
+
+
+SIZES = (10_000, 100_000)
+
+# Per-query costs are tiny: repeat them to get measurable timings.
+QUERIES = 200
+
+
+@pytest.fixture(scope="module")
+def chains():
+    return {size: build_graph(chain(size)) for size in SIZES}
+
+
+# ============================================================
+# COMPLEXITY
+# ============================================================
+# Timing-based: slow, and excluded from tier-1 CI.
+
+@pytest.mark.slow
+def test_adjacency_queries_cost_is_independent_of_graph_size(chains):
+    """
+    Invariant:
+    dependencies_of() and dependents_of() are O(degree).
+    """
+    dependencies = []
+    dependents = []
+
+    for size in SIZES:
+        graph = chains[size]
+        middle = f"n{size // 2}"
+
+        def query_dependencies():
+            for _ in range(QUERIES):
+                graph.dependencies_of(middle)
+
+        def query_dependents():
+            for _ in range(QUERIES):
+                graph.dependents_of(middle)
+
+        dependencies.append(best_time(query_dependencies) / QUERIES)
+        dependents.append(best_time(query_dependents) / QUERIES)
+
+    assert_flat("dependencies_of()", SIZES, dependencies)
+    assert_flat("dependents_of()", SIZES, dependents)
+
+
+@pytest.mark.slow
+def test_roots_and_leaves_cost_is_independent_of_graph_size(chains):
+    """
+    Invariant:
+    roots() and leaves() are maintained incrementally: on a chain
+    (one root, one leaf) their cost does not grow with the graph.
+    """
+    roots = []
+    leaves = []
+
+    for size in SIZES:
+        graph = chains[size]
+
+        def query_roots():
+            for _ in range(QUERIES):
+                graph.roots()
+
+        def query_leaves():
+            for _ in range(QUERIES):
+                graph.leaves()
+
+        roots.append(best_time(query_roots) / QUERIES)
+        leaves.append(best_time(query_leaves) / QUERIES)
+
+    assert_flat("roots()", SIZES, roots)
+    assert_flat("leaves()", SIZES, leaves)
+
+
+# ============================================================
+# INCREMENTAL MAINTENANCE
+# ============================================================
+
+def test_roots_and_leaves_follow_every_added_dependency():
+    """
+    Invariant:
+    roots() and leaves() reflect each add_dependency immediately,
+    in node insertion order.
+    """
+    graph = TaskGraph()
+    for node_id in ("a", "b", "c", "d"):
+        graph.add_node(TaskNode(id=node_id, kind="step", description=node_id))
+
+    assert graph.roots() == ["a", "b", "c", "d"]
+    assert graph.leaves() == ["a", "b", "c", "d"]
+
+    graph.add_dependency("a", "c")
+    assert graph.roots() == ["a", "b", "d"]
+    assert graph.leaves() == ["b", "c", "d"]
+
+    graph.add_dependency("b", "c")
+    assert graph.roots() == ["a", "b", "d"]
+    assert graph.leaves() == ["c", "d"]
+
+    graph.add_dependency("c", "d")
+    assert graph.roots() == ["a", "b"]
+    assert graph.leaves() == ["d"]
+
+
+def test_query_results_are_detached_from_the_graph():
+    """
+    Invariant:
+    Lists returned by queries are snapshots; mutating them never
+    corrupts the adjacency indexes.
+    """
+    graph = TaskGraph()
+    for node_id in ("a", "b"):
+        graph.add_node(TaskNode(id=node_id, kind="step", description=node_id))
+    graph.add_dependency("a", "b")
+
+    graph.dependencies_of("b").append("x")
+    graph.dependents_of("a").clear()
+    graph.roots().append("x")
+    graph.leaves().clear()
+
+    assert graph.dependencies_of("b") == ["a"]
+    assert graph.dependents_of("a") == ["b"]
+    assert graph.roots() == ["a"]
+    assert graph.leaves() == ["b"]
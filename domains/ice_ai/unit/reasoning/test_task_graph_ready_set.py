@@ -0,0 +1,174 @@
+import pytest
+
+from ice_ai.reasoning.task_graph import TaskGraph
+
+from tooling.helpers.task_graph_shapes import GraphShape, build_graph
+
+
+# a -> b -> d
+# a -> c -> d
+# e
+DIAMOND = GraphShape(
+    "diamond",
+    ("a", "b", "c", "d", "e"),
+    (("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")),
+)
+
+# a -> b -> a
+CYCLE = GraphShape("cycle", ("a", "b"), (("a", "b"), ("b", "a")))
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_waves_follow_dependency_levels():
+    """
+    Invariant:
+    waves() yields every node exactly once, in the first wave where all
+    its dependencies were yielded by earlier waves. Each wave keeps
+    insertion order.
+    """
+
+    graph = build_graph(DIAMOND)
+
+    assert list(graph.waves()) == [["a", "e"], ["b", "c"], ["d"]]
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_waves_of_empty_graph_is_empty():
+    """
+    Invariant:
+    An empty graph has no waves.
+    """
+
+    assert list(TaskGraph().waves()) == []
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_waves_reject_cyclic_graph():
+    """
+    Invariant:
+    A graph with a cycle cannot be layered: waves() raises ValueError.
+    """
+
+    graph = build_graph(CYCLE)
+
+    with pytest.raises(ValueError):
+        list(graph.waves())
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_ready_set_releases_dependents_on_completion():
+    """
+    Invariant:
+    complete() returns the dependents whose last pending dependency
+    just completed, and only those.
+    """
+
+    graph = build_graph(DIAMOND)
+    ready_set = graph.ready_set()
+
+    assert ready_set.ready() == ["a", "e"]
+
+    assert ready_set.complete("a") == ["b", "c"]
+    assert ready_set.complete("b") == []
+    assert ready_set.complete("c") == ["d"]
+    assert ready_set.complete("e") == []
+    assert ready_set.finished is False
+
+    assert ready_set.complete("d") == []
+    assert ready_set.finished is True
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_ready_set_lists_ready_nodes_not_yet_completed():
+    """
+    Invariant:
+    ready() lists the nodes whose dependencies are all complete and
+    that are not complete themselves.
+    """
+
+    graph = build_graph(DIAMOND)
+    ready_set = graph.ready_set()
+
+    ready_set.complete("a")
+    assert ready_set.ready() == ["e", "b", "c"]
+
+    ready_set.complete("e")
+    ready_set.complete("b")
+    assert ready_set.ready() == ["c"]
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_ready_set_rejects_invalid_completions():
+    """
+    Invariant:
+    Completing an unknown, not-yet-ready, or already completed node
+    raises ValueError and leaves the ready set unchanged.
+    """
+
+    graph = build_graph(DIAMOND)
+    ready_set = graph.ready_set()
+
+    with pytest.raises(ValueError):
+        ready_set.complete("missing")
+
+    with pytest.raises(ValueError):
+        ready_set.complete("d")
+
+    ready_set.complete("a")
+    with pytest.raises(ValueError):
+        ready_set.complete("a")
+
+    assert ready_set.ready() == ["e", "b", "c"]
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_ready_set_does_not_mutate_graph():
+    """
+    Invariant:
+    Draining a ready set leaves the graph untouched, and independent
+    ready sets over the same graph do not interfere.
+    """
+
+    graph = build_graph(DIAMOND)
+
+    def adjacency():
+        return {
+            node_id: (graph.dependencies_of(node_id), graph.dependents_of(node_id))
+            for node_id in DIAMOND.ids
+        }
+
+    before = adjacency()
+
+    first = graph.ready_set()
+    second = graph.ready_set()
+    for wave in graph.waves():
+        for node_id in wave:
+            first.complete(node_id)
+
+    assert first.finished is True
+    assert second.ready() == ["a", "e"]
+    assert adjacency() == before
+    assert graph.roots() == ["a", "e"]
+    assert graph.leaves() == ["d", "e"]
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_ready_set_rejects_cyclic_graph():
+    """
+    Invariant:
+    A ready set over a cyclic graph could never finish:
+    ready_set() raises ValueError.
+    """
+
+    graph = build_graph(CYCLE)
+
+    with pytest.raises(ValueError):
+        graph.ready_set()
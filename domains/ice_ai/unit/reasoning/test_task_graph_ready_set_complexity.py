@@ -0,0 +1,106 @@
+"""
+Unit tests for TaskGraph ready-set complexity.
+
+Executors derive the ready set from in-degree counters (Kahn), not by
+re-reading dependencies_of() for every node on each tick. These tests
+guarantee that:
+
+- draining waves() costs O(V + E)
+- draining a ready set through complete() costs O(V + E)
+- complete() costs O(out-degree), independent of graph size
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from tooling.helpers.complexity import assert_flat, assert_near_linear, best_time
+from tooling.helpers.task_graph_shapes import SHAPES, build_graph, chain
+
+
+# ============================================================
+# MARKERS
+# ============================================================
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.domain,
+    pytest.mark.slow,
+]
+
+
+SIZES = (10_000, 100_000)
+
+
+@pytest.fixture(scope="module")
+def graphs():
+    """
+    Every shape at every size, built once for the module: waves() and
+    ready_set() never mutate the graph.
+    """
+    return {
+        name: {size: build_graph(shape(size)) for size in SIZES}
+        for name, shape in SHAPES.items()
+    }
+
+
+def drain(graph):
+    ready_set = graph.ready_set()
+    pending = ready_set.ready()
+    while pending:
+        pending.extend(ready_set.complete(pending.pop()))
+    assert ready_set.finished is True
+
+
+# ============================================================
+# COMPLEXITY
+# ============================================================
+
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_waves_scale_linearly(graphs, shape):
+    """
+    Invariant:
+    Iterating every wave of a graph is near-linear in its size,
+    including chains where every wave holds a single node.
+    """
+    timings = []
+    for size in SIZES:
+        graph = graphs[shape][size]
+        timings.append(best_time(lambda: sum(len(wave) for wave in graph.waves())))
+
+    assert_near_linear(f"{shape} waves()", SIZES, timings)
+
+
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_ready_set_drain_scales_linearly(graphs, shape):
+    """
+    Invariant:
+    Completing every node of a graph one at a time is near-linear in
+    its size.
+    """
+    timings = []
+    for size in SIZES:
+        graph = graphs[shape][size]
+        timings.append(best_time(lambda: drain(graph)))
+
+    assert_near_linear(f"{shape} ready_set() drain", SIZES, timings)
+
+
+def test_ready_set_completion_cost_is_independent_of_graph_size(graphs):
+    """
+    Invariant:
+    On a chain, each complete() releases one node at constant cost.
+    """
+    timings = []
+    for size in SIZES:
+        shape = chain(size)
+        graph = graphs["chain"][size]
+
+        def complete_all():
+            ready_set = graph.ready_set()
+            for node_id in shape.ids:
+                ready_set.complete(node_id)
+
+        timings.append(best_time(complete_all) / size)
+
+    assert_flat("ready_set().complete()", SIZES, timings)
@@ -0,0 +1,250 @@
+import os
+import random
+
+import pytest
+
+from ice_ai.reasoning.planner import Planner
+from ice_ai.reasoning.task_graph import TaskGraph
+
+from tooling.helpers.complexity import (
+    assert_flat,
+    assert_near_linear,
+    best_time,
+    peak_memory,
+)
+from tooling.helpers.task_graph_shapes import SHAPES, build_graph, build_plan_graph
+
+
+# Planner output for monorepo refactors reaches tens of thousands of
+# nodes; sizes leave an order of magnitude of headroom above that.
+SIZES = (100_000, 1_000_000)
+
+# Absolute budgets, generous enough for slow CI machines.
+MAX_SECONDS_PER_NODE = 50e-6
+MAX_BYTES_PER_NODE = 4096
+
+# Object storage must cost at least this many times compact storage.
+MIN_COMPACT_REDUCTION = 5
+
+# to_dict() must cost at least this many times a streamed write_json().
+MIN_STREAMING_REDUCTION = 10
+
+# from_plan() must take at most this fraction of incremental construction.
+MAX_BULK_RATIO = 0.8
+
+QUERY_SAMPLE = 2000
+
+
+@pytest.fixture(scope="module", params=sorted(SHAPES))
+def built(request):
+    """
+    One shape at every size, built once for the query tests. Module
+    scope keeps a single shape alive at a time: pytest groups the tests
+    by shape and tears the graphs down before building the next one.
+    """
+    graphs = {}
+    for size in SIZES:
+        data = SHAPES[request.param](size)
+        graphs[size] = data, build_graph(data)
+    return request.param, graphs
+
+
+def sampled_ids(shape):
+    # Skip n0: it is the single hub of fan_out, whose degree is the graph size.
+    rng = random.Random(0)
+    return rng.sample(shape.ids[1:], min(QUERY_SAMPLE, len(shape.ids) - 1))
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.slow
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_task_graph_construction_scales_linearly(shape):
+    """
+    Invariant:
+    Building a graph through add_node/add_dependency costs O(V + E)
+    and stays within the per-node time budget.
+    """
+
+    timings = []
+    for size in SIZES:
+        data = SHAPES[shape](size)
+        timings.append(best_time(lambda: build_graph(data), repeat=1))
+
+    assert_near_linear(f"{shape} construction", SIZES, timings)
+    assert timings[-1] / SIZES[-1] <= MAX_SECONDS_PER_NODE
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.slow
+def test_task_graph_roots_and_leaves_scale_linearly(built):
+    """
+    Invariant:
+    roots() and leaves() cost at most O(V + E).
+    """
+
+    shape, graphs = built
+    roots_timings = []
+    leaves_timings = []
+    for size in SIZES:
+        _, graph = graphs[size]
+        roots_timings.append(best_time(graph.roots))
+        leaves_timings.append(best_time(graph.leaves))
+
+    assert_near_linear(f"{shape} roots()", SIZES, roots_timings)
+    assert_near_linear(f"{shape} leaves()", SIZES, leaves_timings)
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.slow
+def test_task_graph_adjacency_queries_do_not_depend_on_graph_size(built):
+    """
+    Invariant:
+    dependencies_of() and dependents_of() cost O(degree): querying every
+    node of a graph is linear overall, so a single query must not get
+    slower as the graph grows.
+    """
+
+    shape, graphs = built
+    dependencies_timings = []
+    dependents_timings = []
+    for size in SIZES:
+        data, graph = graphs[size]
+        sample = sampled_ids(data)
+
+        def query_dependencies():
+            for node_id in sample:
+                graph.dependencies_of(node_id)
+
+        def query_dependents():
+            for node_id in sample:
+                graph.dependents_of(node_id)
+
+        dependencies_timings.append(best_time(query_dependencies) / len(sample))
+        dependents_timings.append(best_time(query_dependents) / len(sample))
+
+    assert_flat(f"{shape} dependencies_of()", SIZES, dependencies_timings)
+    assert_flat(f"{shape} dependents_of()", SIZES, dependents_timings)
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.slow
+def test_task_graph_is_valid_dag_scales_linearly(built):
+    """
+    Invariant:
+    is_valid_dag() costs O(V + E), including on deep chains
+    (no recursion limit).
+    """
+
+    shape, graphs = built
+    timings = []
+    for size in SIZES:
+        _, graph = graphs[size]
+        assert graph.is_valid_dag() is True
+        timings.append(best_time(graph.is_valid_dag))
+
+    assert_near_linear(f"{shape} is_valid_dag()", SIZES, timings)
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.slow
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_task_graph_memory_per_node_within_budget(shape):
+    """
+    Invariant:
+    A graph costs at most MAX_BYTES_PER_NODE per node, edges included.
+    """
+
+    size = SIZES[0]
+    data = SHAPES[shape](size)
+
+    graph, peak = peak_memory(lambda: build_graph(data))
+
+    assert len(graph.roots()) >= 1
+    assert peak / size <= MAX_BYTES_PER_NODE
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.slow
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_task_graph_compact_storage_reduces_memory(shape):
+    """
+    Invariant:
+    Compact storage (interned ids, CSR edge arrays, capability
+    bitmasks) holds the same graph in at least MIN_COMPACT_REDUCTION
+    times less memory than object storage.
+    """
+
+    size = SIZES[0]
+    data = SHAPES[shape](size)
+
+    objects, objects_peak = peak_memory(lambda: build_graph(data))
+    del objects
+    compact, compact_peak = peak_memory(lambda: build_graph(data, storage="compact"))
+
+    assert len(compact.roots()) >= 1
+    assert objects_peak / compact_peak >= MIN_COMPACT_REDUCTION, (
+        f"{shape}: object storage {objects_peak / size:.0f} B/node, "
+        f"compact storage {compact_peak / size:.0f} B/node"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.slow
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_task_graph_write_json_streams_without_materializing(shape):
+    """
+    Invariant:
+    write_json() keeps the peak memory of serialization far below a
+    to_dict() snapshot, so a large graph never exists twice in memory.
+    """
+
+    size = SIZES[0]
+    data = SHAPES[shape](size)
+
+    _, snapshot_peak = peak_memory(build_graph(data).to_dict)
+
+    graph = build_graph(data)
+    with open(os.devnull, "w", encoding="utf-8") as sink:
+        _, streaming_peak = peak_memory(lambda: graph.write_json(sink))
+
+    assert snapshot_peak / streaming_peak >= MIN_STREAMING_REDUCTION, (
+        f"{shape}: to_dict() peak {snapshot_peak / size:.0f} B/node, "
+        f"write_json() peak {streaming_peak / size:.0f} B/node"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+@pytest.mark.slow
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_task_graph_from_plan_outpaces_incremental_construction(shape):
+    """
+    Invariant:
+    Loading Planner output with from_plan() (one validation pass,
+    indexes built in bulk) is faster than one add_node() per step
+    and one add_dependency() per edge.
+    """
+
+    size = SIZES[0]
+    data = SHAPES[shape](size)
+    steps = Planner.build_plan(
+        goal="Refactor",
+        raw_actions=[{"description": f"Do {node_id}"} for node_id in data.ids],
+    )
+    step_ids = [step.id for step in steps]
+    index = {node_id: idx for idx, node_id in enumerate(data.ids)}
+    edges = [(step_ids[index[source]], step_ids[index[target]]) for source, target in data.edges]
+
+    incremental = best_time(lambda: build_plan_graph(steps, edges), repeat=1)
+    bulk = best_time(lambda: TaskGraph.from_plan(steps, edges), repeat=1)
+
+    assert bulk <= MAX_BULK_RATIO * incremental, (
+        f"{shape}: from_plan() {bulk:.3f}s vs incremental {incremental:.3f}s"
+    )
@@ -0,0 +1,183 @@
+import io
+import json
+
+import pytest
+
+from ice_ai.reasoning.task_graph import TaskGraph, TaskNode
+
+from tooling.helpers.task_graph_shapes import build_graph, random_dag
+
+
+def make_node(node_id, **kwargs):
+    return TaskNode(id=node_id, kind="step", description=node_id, **kwargs)
+
+
+def build(shape):
+    return build_graph(
+        shape, lambda idx, node_id: make_node(node_id, required_capabilities={"analysis"})
+    )
+
+
+class ChunkRecorder:
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, chunk):
+        self.chunks.append(chunk)
+        return len(chunk)
+
+
+# ---------------------------------------------------------------------
+# CACHED SNAPSHOT
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_to_dict_is_cached_until_mutation():
+    """
+    Invariant:
+    An unchanged graph returns the same snapshot object.
+    """
+
+    graph = build(random_dag(50))
+
+    assert graph.to_dict() is graph.to_dict()
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_to_dict_snapshot_is_immutable():
+    """
+    Invariant:
+    The shared snapshot is read-only at every level: mutating it
+    raises TypeError instead of corrupting later to_dict() calls.
+    """
+
+    graph = build(random_dag(50))
+    snapshot = graph.to_dict()
+
+    with pytest.raises(TypeError):
+        snapshot["valid_dag"] = False
+    with pytest.raises(TypeError):
+        snapshot["nodes"]["n0"]["metadata"]["estimated_cost"] = 1
+    with pytest.raises(TypeError):
+        snapshot["edges"].append(["n1", "n0"])
+    with pytest.raises(TypeError):
+        snapshot["roots"].clear()
+
+    assert graph.to_dict()["valid_dag"] is True
+    assert ["n1", "n0"] not in graph.to_dict()["edges"]
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_to_dict_is_invalidated_by_every_mutation():
+    """
+    Invariant:
+    add_node() and add_dependency() invalidate the snapshot, and
+    earlier snapshots keep describing the graph they were taken from.
+    """
+
+    graph = TaskGraph()
+    graph.add_node(make_node("a"))
+    first = graph.to_dict()
+
+    graph.add_node(make_node("b"))
+    second = graph.to_dict()
+
+    graph.add_dependency("a", "b")
+    third = graph.to_dict()
+
+    assert list(first["nodes"]) == ["a"]
+    assert list(second["nodes"]) == ["a", "b"]
+    assert second["edges"] == []
+    assert second["roots"] == ["a", "b"]
+    assert third["edges"] == [["a", "b"]]
+    assert third["roots"] == ["a"]
+    assert third["leaves"] == ["b"]
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_to_dict_tracks_cycle_flag():
+    """
+    Invariant:
+    valid_dag in a snapshot follows the edge that closed a cycle.
+    """
+
+    graph = TaskGraph()
+    graph.add_node(make_node("a"))
+    graph.add_node(make_node("b"))
+    graph.add_dependency("a", "b")
+    assert graph.to_dict()["valid_dag"] is True
+
+    graph.add_dependency("b", "a")
+    assert graph.to_dict()["valid_dag"] is False
+
+
+# ---------------------------------------------------------------------
+# STREAMING
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_write_json_matches_to_dict():
+    """
+    Invariant:
+    write_json(fp) writes the JSON document of to_dict().
+    """
+
+    graph = build(random_dag(200))
+    graph.add_node(
+        make_node(
+            "x",
+            required_capabilities={"planning", "analysis"},
+            suggested_agent="analyzer",
+            metadata={"source": "unit-test", "estimated_cost": 2.5},
+        )
+    )
+
+    buffer = io.StringIO()
+    graph.write_json(buffer)
+
+    assert json.loads(buffer.getvalue()) == json.loads(json.dumps(graph.to_dict()))
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_write_json_of_empty_graph():
+    """
+    Invariant:
+    An empty graph streams a complete, empty snapshot.
+    """
+
+    buffer = io.StringIO()
+    TaskGraph().write_json(buffer)
+
+    assert json.loads(buffer.getvalue()) == {
+        "nodes": {},
+        "edges": [],
+        "roots": [],
+        "leaves": [],
+        "valid_dag": True,
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_task_graph_write_json_writes_in_bounded_chunks():
+    """
+    Invariant:
+    write_json() never renders the document as a single string: it
+    writes many chunks, none of them proportional to the graph.
+    """
+
+    graph = build(random_dag(5000))
+    recorder = ChunkRecorder()
+
+    graph.write_json(recorder)
+
+    document = "".join(recorder.chunks)
+    assert json.loads(document) == json.loads(json.dumps(graph.to_dict()))
+    assert len(recorder.chunks) > 10
+    assert max(len(chunk) for chunk in recorder.chunks) < len(document) / 10
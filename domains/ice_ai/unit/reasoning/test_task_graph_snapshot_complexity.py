@@ -0,0 +1,77 @@
+"""
+Unit tests for TaskGraph snapshot complexity.
+
+Observers call to_dict() every few seconds on graphs that rarely change.
+These tests guarantee that:
+
+- to_dict() on an unchanged graph costs O(1)
+- rebuilding a snapshot after a mutation costs O(V + E)
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from ice_ai.reasoning.task_graph import TaskNode
+
+from tooling.helpers.complexity import assert_flat, assert_near_linear, best_time
+from tooling.helpers.task_graph_shapes import build_graph, random_dag
+
+
+# ============================================================
+# MARKERS
+# ============================================================
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.domain,
+    pytest.mark.slow,
+]
+
+
+SIZES = (10_000, 100_000)
+
+QUERIES = 1000
+
+
+# ============================================================
+# COMPLEXITY
+# ============================================================
+
+def test_cached_snapshot_cost_is_independent_of_graph_size():
+    """
+    Invariant:
+    Repeated to_dict() calls on an unchanged graph reuse the snapshot.
+    """
+    timings = []
+    for size in SIZES:
+        graph = build_graph(random_dag(size))
+        graph.to_dict()
+
+        def query():
+            for _ in range(QUERIES):
+                graph.to_dict()
+
+        timings.append(best_time(query) / QUERIES)
+
+    assert_flat("cached to_dict()", SIZES, timings)
+
+
+def test_snapshot_after_mutation_scales_linearly():
+    """
+    Invariant:
+    A mutation invalidates the snapshot; the next to_dict() rebuilds
+    it in near-linear time.
+    """
+    timings = []
+    for size in SIZES:
+        graph = build_graph(random_dag(size))
+        counter = iter(range(size))
+
+        def mutate_and_snapshot():
+            graph.add_node(TaskNode(id=f"extra{next(counter)}", kind="step", description="extra"))
+            graph.to_dict()
+
+        timings.append(best_time(mutate_and_snapshot))
+
+    assert_near_linear("to_dict() after mutation", SIZES, timings)
@@ -0,0 +1,97 @@
+#!/usr/bin/env bash
+#
+# CI entrypoint for Tier 1 (domain CI): unit, integration and contract
+# tests of every domain. See docs/ci-strategy.md.
+#
+# Usage:
+#   ./scripts/ci_entrypoint.sh [--shard I/N] [pytest args...]
+#   ./scripts/ci_entrypoint.sh --benchmarks [pytest args...]
+#
+# Shards are balanced using the duration history in ICE_DURATIONS, which
+# every shard must read. Without it, tests are split by nodeid hash only.
+#
+# Benchmarks and slow tests are excluded from the sharded run. --benchmarks
+# runs the benchmarks alone, without xdist, gated against
+# governance/regression/benchmarks.json.
+#
+# A -m expression narrows the run; it is combined with the run's own
+# selection and never widens it.
+#   ./scripts/ci_entrypoint.sh -m unit          # tier-1 unit tests only
+#
+# Environment:
+#   ICE_SHARD       shard to run when --shard is not given (e.g. 2/4)
+#   ICE_DURATIONS   duration history file shared by all shards
+#   ICE_WORKERS     number of xdist workers per machine (default: auto)
+
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+
+SHARD="${ICE_SHARD:-}"
+BENCHMARKS=0
+MARKEXPR=""
+ARGS=()
+
+while [ "$#" -gt 0 ]; do
+  case "$1" in
+    --shard)
+      SHARD="${2:?--shard expects I/N}"
+      shift 2
+      ;;
+    --shard=*)
+      SHARD="${1#--shard=}"
+      shift
+      ;;
+    --benchmarks)
+      BENCHMARKS=1
+      shift
+      ;;
+    -m)
+      MARKEXPR="${2:?-m expects an expression}"
+      shift 2
+      ;;
+    -m*)
+      MARKEXPR="${1#-m}"
+      shift
+      ;;
+    *)
+      ARGS+=("$1")
+      shift
+      ;;
+  esac
+done
+
+SHARD_ARGS=()
+if [ -n "${SHARD}" ]; then
+  SHARD_ARGS=(--shard "${SHARD}")
+fi
+
+if [ "${BENCHMARKS}" -eq 1 ]; then
+  SELECTION="benchmark"
+else
+  SELECTION="(unit or integration or contract) and not benchmark and not slow"
+fi
+if [ -n "${MARKEXPR}" ]; then
+  SELECTION="(${MARKEXPR}) and (${SELECTION})"
+fi
+
+cd "${ROOT}"
+
+if [ "${BENCHMARKS}" -eq 1 ]; then
+  exec python -m pytest \
+    -p no:xdist \
+    -m "${SELECTION}" \
+    --ice-benchmark-compare \
+    domains \
+    "${ARGS[@]+"${ARGS[@]}"}"
+fi
+
+exec python -m pytest \
+  -n "${ICE_WORKERS:-auto}" \
+  --dist load \
+  --ice-schedule \
+  -m "${SELECTION}" \
+  "${SHARD_ARGS[@]+"${SHARD_ARGS[@]}"}" \
+  domains \
+  tooling/tests \
+  "${ARGS[@]+"${ARGS[@]}"}"
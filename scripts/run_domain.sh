@@ -0,0 +1,85 @@
+#!/usr/bin/env bash
+#
+# Run the test suite of a single ICE domain.
+#
+# Usage:
+#   ./scripts/run_domain.sh <domain> [pytest args...]
+#
+# Tests are distributed across all cores (pytest-xdist) and ordered by
+# LEVEL marker, then longest-first by recorded duration.
+# Unchanged test files that cannot match a -m selection are not imported.
+#
+# Slow tests (@pytest.mark.slow) are opt-in: they are deselected unless
+# --slow is given. A -m expression is combined with "not slow".
+#   ./scripts/run_domain.sh ice_ai -m unit          # unit, without slow
+#   ./scripts/run_domain.sh ice_ai -m unit --slow   # unit, slow included
+#
+# Selection mode (run only tests affected by a change to ice_ai):
+#   ./scripts/run_domain.sh ice_ai --ice-changed ice_ai/reasoning/task_graph.py
+#   ./scripts/run_domain.sh ice_ai --ice-impact-record   # refresh the impact map
+#
+# Environment:
+#   ICE_WORKERS   number of xdist workers (default: auto)
+
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+
+if [ "$#" -lt 1 ]; then
+  echo "usage: $0 <domain> [pytest args...]" >&2
+  exit 2
+fi
+
+DOMAIN="$1"
+shift
+
+if [ ! -d "${ROOT}/domains/${DOMAIN}" ]; then
+  echo "unknown domain: ${DOMAIN}" >&2
+  exit 2
+fi
+
+SLOW=0
+MARKEXPR=""
+ARGS=()
+
+while [ "$#" -gt 0 ]; do
+  case "$1" in
+    --slow)
+      SLOW=1
+      shift
+      ;;
+    -m)
+      MARKEXPR="${2:?-m expects an expression}"
+      shift 2
+      ;;
+    -m*)
+      MARKEXPR="${1#-m}"
+      shift
+      ;;
+    *)
+      ARGS+=("$1")
+      shift
+      ;;
+  esac
+done
+
+MARK_ARGS=()
+if [ "${SLOW}" -eq 1 ]; then
+  # An empty expression overrides the "not slow" default of pyproject.toml.
+  MARK_ARGS=(-m "${MARKEXPR}")
+elif [ -n "${MARKEXPR}" ]; then
+  MARK_ARGS=(-m "(${MARKEXPR}) and not slow")
+else
+  MARK_ARGS=(-m "not slow")
+fi
+
+cd "${ROOT}"
+
+exec python -m pytest \
+  -n "${ICE_WORKERS:-auto}" \
+  --dist load \
+  --ice-schedule \
+  --ice-collect-cache \
+  "${MARK_ARGS[@]+"${MARK_ARGS[@]}"}" \
+  "domains/${DOMAIN}" \
+  "${ARGS[@]+"${ARGS[@]}"}"
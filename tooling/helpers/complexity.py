@@ -0,0 +1,83 @@
+"""
+Empirical complexity checks for performance tests.
+
+Wall-clock budgets are machine dependent; growth ratios are not.
+These helpers compare the cost per element of an operation at two or
+more input sizes: a linear operation keeps it flat, a quadratic one
+multiplies it by the size ratio.
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+
+
+def best_time(fn, repeat: int = 3) -> float:
+    """
+    Returns the best wall-clock time of ``fn()`` over ``repeat`` runs.
+
+    The garbage collector is paused while timing.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def peak_memory(fn):
+    """
+    Returns ``(result, peak_bytes)`` of ``fn()``, measured with tracemalloc.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def cost_growth(sizes, timings) -> float:
+    """
+    Returns how much the cost per element grew from the smallest size
+    to the largest one (1.0 means perfectly linear).
+    """
+    pairs = sorted(zip(sizes, timings))
+    (small_n, small_t), (large_n, large_t) = pairs[0], pairs[-1]
+    small = max(small_t, 1e-9) / small_n
+    large = max(large_t, 1e-9) / large_n
+    return large / small
+
+
+def assert_near_linear(label, sizes, timings, tolerance: float = 3.0) -> None:
+    """
+    Fails when the cost per element grows by more than ``tolerance``.
+    """
+    growth = cost_growth(sizes, timings)
+    detail = ", ".join(f"n={n}: {t:.4f}s" for n, t in zip(sizes, timings))
+    assert growth <= tolerance, (
+        f"{label} is not near-linear: cost per element grew {growth:.1f}x ({detail})"
+    )
+
+
+def assert_flat(label, sizes, timings, tolerance: float = 3.0) -> None:
+    """
+    Fails when a per-operation cost grows by more than ``tolerance``
+    across sizes (expected O(1) or O(degree) with bounded degree).
+    """
+    pairs = sorted(zip(sizes, timings))
+    growth = max(pairs[-1][1], 1e-9) / max(pairs[0][1], 1e-9)
+    detail = ", ".join(f"n={n}: {t * 1e6:.2f}us" for n, t in pairs)
+    assert growth <= tolerance, (
+        f"{label} depends on graph size: cost grew {growth:.1f}x ({detail})"
+    )
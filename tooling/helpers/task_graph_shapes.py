@@ -0,0 +1,121 @@
+"""
+Synthetic TaskGraph shapes for scaling and performance tests.
+
+Shapes are pure data (node ids and dependency edges), so the same shape
+can be loaded into any TaskGraph construction path; build_graph() is the
+incremental add_node()/add_dependency() one. build_plan_graph() loads
+Planner steps the same way, as the reference for TaskGraph.from_plan().
+All shapes are acyclic and deterministic for a given size and seed.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass(frozen=True)
+class GraphShape:
+    name: str
+    ids: tuple[str, ...]
+    edges: tuple[tuple[str, str], ...]
+
+
+def node_ids(size: int) -> tuple[str, ...]:
+    return tuple(f"n{idx}" for idx in range(size))
+
+
+def chain(size: int) -> GraphShape:
+    """
+    n0 -> n1 -> ... -> n(size-1): maximal depth.
+    """
+    ids = node_ids(size)
+    edges = tuple(zip(ids, ids[1:]))
+    return GraphShape("chain", ids, edges)
+
+
+def fan_out(size: int) -> GraphShape:
+    """
+    n0 -> every other node: maximal degree.
+    """
+    ids = node_ids(size)
+    edges = tuple((ids[0], node) for node in ids[1:])
+    return GraphShape("fan_out", ids, edges)
+
+
+def random_dag(size: int, parents: int = 2, window: int = 1000, seed: int = 0) -> GraphShape:
+    """
+    Every node depends on up to ``parents`` random earlier nodes
+    within ``window`` positions: realistic plans with local structure.
+    """
+    rng = random.Random(seed)
+    ids = node_ids(size)
+    edges = []
+    for idx in range(1, size):
+        low = max(0, idx - window)
+        for parent in {rng.randrange(low, idx) for _ in range(parents)}:
+            edges.append((ids[parent], ids[idx]))
+    return GraphShape("random_dag", ids, tuple(edges))
+
+
+SHAPES = {
+    "chain": chain,
+    "fan_out": fan_out,
+    "random_dag": random_dag,
+}
+
+
+def step_node(idx: int, node_id: str):
+    from ice_ai.reasoning.task_graph import TaskNode
+
+    return TaskNode(id=node_id, kind="step", description=node_id)
+
+
+def build_graph(shape: GraphShape, make_node: Callable | None = None, **options):
+    """
+    Loads a shape into TaskGraph(**options), one add_node() per id and
+    one add_dependency() per edge, in shape order.
+
+    ``make_node(idx, node_id)`` builds each TaskNode (default: a bare
+    "step" node). Only the options given are passed to TaskGraph, so
+    its defaults stay under test.
+    """
+    # Imported lazily: shapes stay importable without ice_ai.
+    from ice_ai.reasoning.task_graph import TaskGraph
+
+    make_node = make_node or step_node
+    graph = TaskGraph(**options)
+    for idx, node_id in enumerate(shape.ids):
+        graph.add_node(make_node(idx, node_id))
+    for source, target in shape.edges:
+        graph.add_dependency(source, target)
+    return graph
+
+
+def build_plan_graph(steps, edges, **options):
+    """
+    Loads Planner steps into TaskGraph(**options), one add_node() per
+    step and one add_dependency() per edge: the reference that
+    TaskGraph.from_plan() must match, and outpace.
+
+    Each PlanStep maps to a TaskNode as in from_plan(): type as kind,
+    agent_hint as suggested_agent, title and payload in metadata.
+    Kept a plain loop, so timings measure TaskGraph, not this helper.
+    """
+    from ice_ai.reasoning.task_graph import TaskGraph, TaskNode
+
+    graph = TaskGraph(**options)
+    for step in steps:
+        graph.add_node(
+            TaskNode(
+                id=step.id,
+                kind=step.type,
+                description=step.description,
+                suggested_agent=step.agent_hint,
+                metadata={"title": step.title, "payload": dict(step.payload)},
+            )
+        )
+    for source, target in edges:
+        graph.add_dependency(source, target)
+    return graph
@@ -0,0 +1,62 @@
+"""
+Synthetic node handlers for TaskGraph execution tests.
+
+Handlers are module-level functions so that process pools can pickle
+them by reference. Each handler reads its parameters from the node's
+``metadata`` and returns the node id.
+"""
+
+from __future__ import annotations
+
+import time
+
+from ice_ai.reasoning.task_graph import TaskGraph, TaskNode
+
+from tooling.helpers.task_graph_shapes import build_graph
+
+
+def sleep_bound(node) -> str:
+    """
+    Sleeps ``metadata["seconds"]``: IO-like work that releases the GIL.
+    """
+    time.sleep(node.metadata["seconds"])
+    return node.id
+
+
+def cpu_bound(node) -> str:
+    """
+    Spins for ``metadata["iterations"]``: work that holds the GIL.
+    """
+    total = 0
+    for idx in range(node.metadata["iterations"]):
+        total += idx * idx
+    return node.id
+
+
+def failing(node) -> str:
+    raise RuntimeError(f"{node.id} failed")
+
+
+HANDLERS = {
+    "sleep": sleep_bound,
+    "cpu": cpu_bound,
+    "fail": failing,
+}
+
+
+def workload_graph(shape, kind: str, kinds=None, **metadata) -> TaskGraph:
+    """
+    Loads a GraphShape with every node of the given kind and metadata.
+
+    ``kinds`` maps node ids to another kind, e.g. {"bad": "fail"}.
+    """
+    kinds = kinds or {}
+    return build_graph(
+        shape,
+        lambda idx, node_id: TaskNode(
+            id=node_id,
+            kind=kinds.get(node_id, kind),
+            description=node_id,
+            metadata=dict(metadata),
+        ),
+    )
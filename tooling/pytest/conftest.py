@@ -6,6 +6,7 @@ It provides:
 - canonical marker registration
 - strict marker enforcement
 - explicit environment loading
+- registration of the ICE tooling plugins
 
 No heavy fixtures live here.
 """
@@ -15,6 +16,27 @@ import pytest
 from pathlib import Path
 
 from tooling.pytest.markers import get_all_markers
+from tooling.pytest.validation import MarkerValidator, format_violations
+
+
+# =========================
+# PLUGINS
+# =========================
+
+# Plugins stay inert unless enabled through their command line options,
+# except duration recording, which is cheap and always on.
+# Plugins are listed after the plugins they import from.
+pytest_plugins = [
+    "tooling.pytest.plugins.impact",
+    "tooling.pytest.plugins.collection_manifest",
+    "tooling.pytest.plugins.result_cache",
+    "tooling.pytest.plugins.durations",
+    "tooling.pytest.plugins.scheduling",
+    "tooling.pytest.plugins.sharding",
+    "tooling.pytest.plugins.benchmark",
+    "tooling.pytest.plugins.regression",
+    "tooling.pytest.plugins.import_budgets",
+]
 
 
 # =========================
@@ -39,26 +61,13 @@ def pytest_collection_modifyitems(config, items):
     Enforce that every test has at least:
     - one LEVEL marker
     - one SCOPE marker
+
+    All violations are reported at once.
     """
-    level_markers = {"unit", "integration", "contract", "e2e", "scenario"}
-    scope_markers = {"domain", "aggregate", "core", "product"}
-
-    for item in items:
-        item_markers = {m.name for m in item.iter_markers()}
-
-        if not (item_markers & level_markers):
-            pytest.fail(
-                f"Test '{item.nodeid}' has no LEVEL marker "
-                f"(one of {sorted(level_markers)})",
-                pytrace=False,
-            )
-
-        if not (item_markers & scope_markers):
-            pytest.fail(
-                f"Test '{item.nodeid}' has no SCOPE marker "
-                f"(one of {sorted(scope_markers)})",
-                pytrace=False,
-            )
+    violations = MarkerValidator().validate(items)
+
+    if violations:
+        raise pytest.UsageError(format_violations(violations))
 
 
 # =========================
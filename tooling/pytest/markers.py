@@ -39,6 +39,7 @@ EXECUTION_MARKERS = {
     "destructive": "Tests that modify or destroy state",
     "requires_network": "Tests requiring network access",
     "requires_gpu": "Tests requiring GPU availability",
+    "benchmark": "Performance measurements using the benchmark fixture",
 }
 
 # =========================
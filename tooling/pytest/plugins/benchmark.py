@@ -0,0 +1,330 @@
+"""
+Micro-benchmark fixture for ICE Tests.
+
+Provides the ``benchmark`` fixture:
+
+    @pytest.mark.unit
+    @pytest.mark.domain
+    @pytest.mark.benchmark
+    def test_router_route_throughput(benchmark):
+        benchmark(Router.route, user_query="q", llm_output={"answer": "a"})
+
+Each measurement:
+- warms up the callable for a fixed time
+- calibrates the number of iterations per round so that one round
+  lasts at least ``--ice-benchmark-min-time``
+- times ``--ice-benchmark-rounds`` rounds
+- rejects outliers outside the Tukey fences (1.5 IQR)
+- reports robust statistics per iteration (median, IQR, ...)
+
+Tests using the fixture must carry the ``benchmark`` EXECUTION marker.
+
+Results of the session are written as JSON (``--ice-benchmark-json``,
+default ``.pytest_cache/d/ice/benchmarks.json``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import pytest
+
+
+SCHEMA_VERSION = 1
+
+BENCHMARK_PROPERTY = "ice_benchmark"
+
+# Tukey fences: samples further than this many IQRs from the quartiles
+# are outliers.
+OUTLIER_IQR = 1.5
+
+# Upper bound for calibration, to keep trivially cheap callables bounded.
+MAX_ITERATIONS = 1 << 24
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ice-benchmark", "ICE micro-benchmarks")
+    group.addoption(
+        "--ice-benchmark-json",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Write benchmark results to PATH (default: pytest cache).",
+    )
+    group.addoption(
+        "--ice-benchmark-rounds",
+        action="store",
+        type=int,
+        default=20,
+        help="Number of timed rounds per benchmark (default: 20).",
+    )
+    group.addoption(
+        "--ice-benchmark-min-time",
+        action="store",
+        type=float,
+        default=0.005,
+        help="Minimum duration of one round, in seconds (default: 0.005).",
+    )
+    group.addoption(
+        "--ice-benchmark-warmup",
+        action="store",
+        type=float,
+        default=0.05,
+        help="Warmup duration before calibration, in seconds (default: 0.05).",
+    )
+
+
+# =========================
+# STATISTICS
+# =========================
+
+@dataclass(frozen=True)
+class BenchmarkStats:
+    """
+    Robust statistics of one benchmark, in seconds per iteration.
+    """
+
+    rounds: int
+    iterations: int
+    outliers: int
+    median: float
+    q1: float
+    q3: float
+    iqr: float
+    mean: float
+    stdev: float
+    min: float
+    max: float
+    samples: tuple[float, ...]
+
+    @classmethod
+    def from_samples(cls, samples, iterations: int) -> "BenchmarkStats":
+        """
+        Computes statistics after rejecting outliers outside the Tukey fences.
+
+        ``samples`` holds one time per round, already divided by iterations.
+        """
+        samples = sorted(samples)
+        q1, _, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+        iqr = q3 - q1
+        low = q1 - OUTLIER_IQR * iqr
+        high = q3 + OUTLIER_IQR * iqr
+        kept = [s for s in samples if low <= s <= high] or samples
+
+        q1, median, q3 = statistics.quantiles(kept, n=4, method="inclusive")
+        return cls(
+            rounds=len(samples),
+            iterations=iterations,
+            outliers=len(samples) - len(kept),
+            median=median,
+            q1=q1,
+            q3=q3,
+            iqr=q3 - q1,
+            mean=statistics.fmean(kept),
+            stdev=statistics.stdev(kept) if len(kept) > 1 else 0.0,
+            min=kept[0],
+            max=kept[-1],
+            samples=tuple(kept),
+        )
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["samples"] = list(self.samples)
+        return data
+
+
+# =========================
+# FIXTURE
+# =========================
+
+class Benchmark:
+    """
+    Callable measuring a function with warmup, calibration and rounds.
+    """
+
+    def __init__(
+        self,
+        name,
+        rounds,
+        min_time,
+        warmup,
+        timer=time.perf_counter,
+        on_result=None,
+    ):
+        self.name = name
+        self.rounds = rounds
+        self.min_time = min_time
+        self.warmup = warmup
+        self.timer = timer
+        self.on_result = on_result
+        self.stats = None
+
+    def _run(self, fn, args, kwargs, iterations):
+        timer = self.timer
+        start = timer()
+        for _ in range(iterations):
+            result = fn(*args, **kwargs)
+        return timer() - start, result
+
+    def _calibrate(self, fn, args, kwargs) -> int:
+        deadline = self.timer() + self.warmup
+        while self.timer() < deadline:
+            fn(*args, **kwargs)
+
+        iterations = 1
+        while iterations < MAX_ITERATIONS:
+            elapsed, _ = self._run(fn, args, kwargs, iterations)
+            if elapsed >= self.min_time:
+                break
+            iterations *= 2
+        return iterations
+
+    def __call__(self, fn, *args, **kwargs):
+        if self.stats is not None:
+            raise RuntimeError(f"{self.name}: benchmark fixture can only be used once per test")
+
+        iterations = self._calibrate(fn, args, kwargs)
+
+        samples = []
+        result = None
+        for _ in range(max(2, self.rounds)):
+            elapsed, result = self._run(fn, args, kwargs, iterations)
+            samples.append(elapsed / iterations)
+
+        self.stats = BenchmarkStats.from_samples(samples, iterations)
+        if self.on_result is not None:
+            self.on_result(self.name, self.stats)
+        return result
+
+
+@pytest.fixture
+def benchmark(request):
+    """
+    Measures a callable: ``benchmark(fn, *args, **kwargs)``.
+    """
+    if request.node.get_closest_marker("benchmark") is None:
+        pytest.fail(
+            f"{request.node.nodeid} uses the benchmark fixture "
+            "without the 'benchmark' marker",
+            pytrace=False,
+        )
+
+    config = request.config
+    gate = config.pluginmanager.get_plugin("ice-regression-gate")
+    bench = Benchmark(
+        name=request.node.nodeid,
+        rounds=config.getoption("ice_benchmark_rounds"),
+        min_time=config.getoption("ice_benchmark_min_time"),
+        warmup=config.getoption("ice_benchmark_warmup"),
+        on_result=gate.check if gate is not None else None,
+    )
+    yield bench
+
+    if bench.stats is not None:
+        # Forwarded with the report, so xdist workers reach the controller.
+        request.node.user_properties.append((BENCHMARK_PROPERTY, bench.stats.to_dict()))
+
+
+# =========================
+# RESULTS
+# =========================
+
+def machine_info(label: str | None = None) -> dict:
+    """
+    Describes the machine running the session.
+
+    ``label`` names the machine class explicitly
+    (``--ice-benchmark-machine``).
+    """
+    info = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+    if label:
+        info["label"] = label
+    return info
+
+
+def machine_class(info: dict) -> dict:
+    """
+    Returns the part of ``machine_info`` that makes timings comparable.
+
+    An explicit label wins. Otherwise the key leaves out what changes
+    with every runner image update (OS build, Python patch version).
+    """
+    if info.get("label"):
+        return {"label": info["label"]}
+    return {
+        "implementation": info.get("implementation"),
+        "python": ".".join(str(info.get("python", "")).split(".")[:2]),
+        "machine": info.get("machine"),
+        "cpu_count": info.get("cpu_count"),
+    }
+
+
+class BenchmarkResults:
+    """
+    Collects benchmark statistics and writes them as JSON.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.results = {}
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == BENCHMARK_PROPERTY:
+                self.results[report.nodeid] = value
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput") or not self.results:
+            return
+
+        explicit = self.config.getoption("ice_benchmark_json")
+        if explicit:
+            path = Path(explicit)
+        elif hasattr(self.config, "cache"):
+            path = self.config.cache.mkdir("ice") / "benchmarks.json"
+        else:
+            # -p no:cacheprovider and no explicit file: nowhere to write.
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(
+                {
+                    "schema_version": SCHEMA_VERSION,
+                    "machine": machine_info(),
+                    "benchmarks": self.results,
+                },
+                indent=2,
+                sort_keys=True,
+            ),
+            encoding="utf-8",
+        )
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.results:
+            return
+        terminalreporter.section("ice benchmarks")
+        for nodeid, stats in sorted(self.results.items()):
+            terminalreporter.write_line(
+                f"{nodeid}: median {stats['median'] * 1e6:.3f} us "
+                f"(IQR {stats['iqr'] * 1e6:.3f} us, "
+                f"{stats['rounds']} rounds x {stats['iterations']}, "
+                f"{stats['outliers']} outliers)"
+            )
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(BenchmarkResults(config), "ice-benchmark-results")
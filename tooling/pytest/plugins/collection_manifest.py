@@ -0,0 +1,234 @@
+"""
+Persistent collection manifest for ICE Tests.
+
+Collecting a test file imports it, and therefore ``ice_ai``.
+With ``--ice-collect-cache``, every collection records, per test file:
+
+- its mtime and size
+- its tests (nodeids) and their marker names
+- the ``ice_ai`` sources it imports, with their mtimes
+
+On the next run with a marker selection (``-m unit``), a file whose
+recorded state is unchanged and whose recorded tests cannot match the
+expression is not collected at all: it is neither imported nor
+re-validated.
+
+Files are always collected when anything recorded about them changed,
+when they are unknown, or when the expression cannot be evaluated from
+marker names alone.
+
+A partial collection (``file.py::test``, ``--lf``) never shrinks the
+recorded tests of an unchanged file: new tests are merged in. A changed
+file that was only partially collected is forgotten, so it is collected
+again next time.
+
+The manifest lives in the pytest cache (``ice/collection.json``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from _pytest.mark.expression import Expression
+
+from tooling.pytest.plugins.impact import module_source, static_dependencies
+from tooling.pytest.validation import MarkerValidator
+
+
+MANIFEST_VERSION = 1
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ice-collect-cache", "ICE collection manifest")
+    group.addoption(
+        "--ice-collect-cache",
+        action="store_true",
+        default=False,
+        help="Skip importing unchanged test files that cannot match -m.",
+    )
+
+
+class _NeedsCollection(Exception):
+    """
+    Raised when an expression cannot be decided from marker names.
+    """
+
+
+def _stat(path: Path):
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class CollectionManifest:
+    """
+    Records collected files and skips the ones -m would fully deselect.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.root = config.rootpath
+        self.path = config.cache.mkdir("ice") / "collection.json"
+        self.files = self._load()
+        self.skipped = 0
+        self.partial = self._partially_collected(config)
+
+        self.expression = None
+        markexpr = config.getoption("markexpr")
+        if markexpr:
+            try:
+                self.expression = Expression.compile(markexpr)
+            except Exception:
+                # ParseError or SyntaxError depending on the pytest version;
+                # pytest reports the invalid expression itself.
+                self.expression = None
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def _partially_collected(self, config):
+        """
+        Returns the files collected partially in this session, or None
+        when --lf may filter any file.
+        """
+        if config.getoption("lf", False):
+            return None
+        partial = set()
+        for arg in config.args:
+            if "::" in arg:
+                path = Path(config.invocation_params.dir) / arg.split("::")[0]
+                partial.add(self._key(path.resolve()))
+        return partial
+
+    def _is_partial(self, key: str) -> bool:
+        return self.partial is None or key in self.partial
+
+    def _key(self, path: Path) -> str:
+        try:
+            return str(Path(path).relative_to(self.root))
+        except ValueError:
+            return str(path)
+
+    # -------------------------
+    # Skipping
+    # -------------------------
+
+    def _is_fresh(self, path: Path, entry: dict) -> bool:
+        if list(_stat(path) or ()) != entry.get("stat"):
+            return False
+        for source, recorded in entry.get("imports", {}).items():
+            if list(_stat(Path(source)) or ()) != recorded:
+                return False
+        return True
+
+    def _can_match(self, entry: dict) -> bool:
+        for names in entry.get("tests", {}).values():
+            names = set(names)
+
+            def matcher(name, **kwargs):
+                if kwargs:
+                    raise _NeedsCollection
+                return name in names
+
+            try:
+                if self.expression.evaluate(matcher):
+                    return True
+            except _NeedsCollection:
+                return True
+        return False
+
+    def pytest_ignore_collect(self, collection_path, config):
+        if self.expression is None or collection_path.suffix != ".py":
+            return None
+
+        entry = self.files.get(self._key(collection_path))
+        if entry is None or not self._is_fresh(collection_path, entry):
+            return None
+        if self._can_match(entry):
+            return None
+
+        self.skipped += 1
+        return True
+
+    # -------------------------
+    # Recording
+    # -------------------------
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, config, items):
+        # Runs before -m deselection, so every test of a file is recorded.
+        validator = MarkerValidator()
+        collected = {}
+        for item in items:
+            path = Path(item.path)
+            key = self._key(path)
+            entry = collected.get(key)
+            if entry is None:
+                entry = collected[key] = self._describe(path)
+            entry["tests"][item.nodeid] = sorted(validator.marker_names(item))
+
+        for key, entry in collected.items():
+            if not self._is_partial(key):
+                self.files[key] = entry
+                continue
+            previous = self.files.pop(key, None)
+            if previous is not None and self._is_fresh(self.root / key, previous):
+                # Unchanged file: the earlier full list still holds.
+                entry["tests"] = {**previous.get("tests", {}), **entry["tests"]}
+                self.files[key] = entry
+        self._save()
+
+    def _describe(self, path: Path) -> dict:
+        imports = {}
+        for module in static_dependencies(path):
+            source = module_source(module)
+            stat = _stat(source) if source is not None else None
+            if stat is not None:
+                imports[str(source)] = list(stat)
+
+        return {
+            "stat": list(_stat(path) or ()),
+            "imports": imports,
+            "tests": {},
+        }
+
+    def _save(self) -> None:
+        workerinput = getattr(self.config, "workerinput", None)
+        if workerinput is not None and workerinput.get("workerid") != "gw0":
+            # Workers collect identical suites: one writer is enough.
+            return
+
+        files = {
+            key: entry
+            for key, entry in self.files.items()
+            if (self.root / key).exists()
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"version": MANIFEST_VERSION, "files": files}),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.skipped:
+            terminalreporter.write_line(
+                f"ice collection manifest: {self.skipped} unchanged files not collected"
+            )
+
+
+def pytest_configure(config):
+    # -p no:cacheprovider leaves nowhere to keep the manifest: collect everything.
+    if config.getoption("ice_collect_cache") and hasattr(config, "cache"):
+        config.pluginmanager.register(CollectionManifest(config), "ice-collection-manifest")
@@ -0,0 +1,257 @@
+"""
+Persistent per-test duration history for ICE Tests.
+
+Every session appends one compact JSON line per test to an on-disk
+history file:
+
+    {"nodeid": "...", "setup": 0.001, "call": 0.120, "teardown": 0.000}
+
+On load, samples are folded into rolling statistics per nodeid
+(exponentially weighted means per phase, sample count, worst total).
+When the file grows too large it is compacted in place: one line per
+nodeid, carrying the folded statistics.
+
+The history feeds the scheduler and CI sharding.
+It is only written by the controller process (never by xdist workers).
+
+The default location lives in the pytest cache directory, so
+``--cache-clear`` wipes it. CI can point ``--ice-durations`` (or
+``ICE_DURATIONS``) at a persisted artifact instead.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from tooling.pytest.plugins.result_cache import CACHED_PROPERTY
+
+
+PHASES = ("setup", "call", "teardown")
+
+# Weight of the latest sample in the rolling means.
+SMOOTHING = 0.3
+
+# Compact once the file holds this many lines per known nodeid.
+COMPACT_RATIO = 8
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ice-durations", "ICE duration history")
+    group.addoption(
+        "--ice-durations",
+        action="store",
+        default=os.environ.get("ICE_DURATIONS"),
+        metavar="PATH",
+        help="Duration history file (default: pytest cache, or $ICE_DURATIONS).",
+    )
+    group.addoption(
+        "--no-ice-durations",
+        action="store_true",
+        default=False,
+        help="Do not record durations for this session.",
+    )
+
+
+# =========================
+# HISTORY MODEL
+# =========================
+
+@dataclass
+class DurationStats:
+    """
+    Rolling statistics for a single nodeid.
+    """
+
+    count: int = 0
+    setup: float = 0.0
+    call: float = 0.0
+    teardown: float = 0.0
+    worst: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.setup + self.call + self.teardown
+
+    def add(self, sample: dict) -> None:
+        weight = int(sample.get("count", 1))
+        if self.count == 0:
+            for phase in PHASES:
+                setattr(self, phase, float(sample.get(phase, 0.0)))
+        else:
+            # A compacted line counts as one (heavier) observation.
+            alpha = min(1.0, SMOOTHING * weight)
+            for phase in PHASES:
+                previous = getattr(self, phase)
+                latest = float(sample.get(phase, 0.0))
+                setattr(self, phase, alpha * latest + (1 - alpha) * previous)
+
+        self.count += weight
+        total = sum(float(sample.get(phase, 0.0)) for phase in PHASES)
+        self.worst = max(self.worst, float(sample.get("worst", total)))
+
+    def to_record(self, nodeid: str) -> dict:
+        return {
+            "nodeid": nodeid,
+            "count": self.count,
+            "setup": round(self.setup, 6),
+            "call": round(self.call, 6),
+            "teardown": round(self.teardown, 6),
+            "worst": round(self.worst, 6),
+        }
+
+
+class DurationHistory:
+    """
+    Append-only duration history keyed by nodeid.
+    """
+
+    def __init__(self, path: Path | None):
+        self.path = Path(path) if path is not None else None
+        self.stats: dict[str, DurationStats] = {}
+        self.lines = 0
+
+    @classmethod
+    def load(cls, path: Path) -> "DurationHistory":
+        history = cls(path)
+        if history.path is None or not history.path.exists():
+            return history
+
+        with history.path.open("r", encoding="utf-8") as fp:
+            for line in fp:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn trailing line from an interrupted run.
+                    continue
+                history._fold(record)
+        return history
+
+    def _fold(self, record: dict) -> None:
+        nodeid = record.get("nodeid")
+        if not nodeid:
+            return
+        self.stats.setdefault(nodeid, DurationStats()).add(record)
+        self.lines += 1
+
+    def estimate(self, nodeid: str, default: float | None = None) -> float | None:
+        """
+        Returns the expected total duration of a test, in seconds.
+        """
+        stats = self.stats.get(nodeid)
+        return stats.total if stats else default
+
+    def estimates(self) -> dict[str, float]:
+        """
+        Returns expected total durations for every known nodeid.
+        """
+        return {nodeid: stats.total for nodeid, stats in self.stats.items()}
+
+    def append(self, samples: dict[str, dict]) -> None:
+        """
+        Appends one sample per nodeid and compacts when needed.
+        """
+        if not samples:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as fp:
+            for nodeid, phases in samples.items():
+                record = {"nodeid": nodeid}
+                record.update({p: round(phases.get(p, 0.0), 6) for p in PHASES})
+                fp.write(json.dumps(record, separators=(",", ":")) + "\n")
+                self._fold(record)
+
+        if self.lines > COMPACT_RATIO * max(1, len(self.stats)):
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Rewrites the file as one statistics line per nodeid.
+        """
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as fp:
+            for nodeid in sorted(self.stats):
+                record = self.stats[nodeid].to_record(nodeid)
+                fp.write(json.dumps(record, separators=(",", ":")) + "\n")
+        os.replace(tmp, self.path)
+        self.lines = len(self.stats)
+
+
+# =========================
+# PLUGIN WIRING
+# =========================
+
+def history_path(config) -> Path | None:
+    """
+    Resolves the duration history location for a session.
+
+    Returns None without an explicit file when the cache provider is
+    disabled: the session then starts from an empty history.
+    """
+    explicit = config.getoption("ice_durations")
+    if explicit:
+        return Path(explicit)
+    if not hasattr(config, "cache"):
+        return None
+    return config.cache.mkdir("ice") / "durations.jsonl"
+
+
+def load_history(config) -> DurationHistory:
+    """
+    Loads the duration history of a session (cached per config).
+    """
+    history = getattr(config, "_ice_duration_history", None)
+    if history is None:
+        history = DurationHistory.load(history_path(config))
+        config._ice_duration_history = history
+    return history
+
+
+class DurationRecorder:
+    """
+    Collects setup, call and teardown durations of the current session.
+
+    Under xdist, report hooks also fire on the controller for every
+    worker report, so the controller sees the whole run.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.samples: dict[str, dict] = {}
+
+    def pytest_runtest_logreport(self, report):
+        if (CACHED_PROPERTY, True) in report.user_properties:
+            # Cached passes did not run: their timing is not a sample.
+            return
+        if report.skipped and report.when != "teardown":
+            # Skipped tests carry no meaningful timing.
+            self.samples.pop(report.nodeid, None)
+            return
+        phases = self.samples.setdefault(report.nodeid, {})
+        phases[report.when] = report.duration
+
+    def pytest_sessionfinish(self, session):
+        complete = {
+            nodeid: phases
+            for nodeid, phases in self.samples.items()
+            if "call" in phases
+        }
+        load_history(self.config).append(complete)
+
+
+def pytest_configure(config):
+    if hasattr(config, "workerinput"):
+        # Only the controller persists history.
+        return
+    if config.getoption("no_ice_durations"):
+        return
+    if history_path(config) is None:
+        # -p no:cacheprovider and no explicit history file: nowhere to write.
+        return
+    config.pluginmanager.register(DurationRecorder(config), "ice-duration-recorder")
@@ -0,0 +1,418 @@
+"""
+Test-impact selection for ICE Tests.
+
+This plugin maps every test to the ``ice_ai`` modules it depends on,
+and runs only the tests affected by a change.
+
+Dependencies come from two sources:
+
+- static: the ``ice_ai`` imports of the test file, followed transitively
+  through the ``ice_ai`` sources (resolved on disk, never imported)
+- dynamic: the ``ice_ai`` modules whose code actually executed during
+  setup, call and teardown, recorded with ``--ice-impact-record``
+
+Recorded dependencies are stored in the pytest cache (``ice/impact.json``).
+
+Selection (``--ice-changed``) accepts module names or file paths:
+
+    --ice-changed ice_ai.reasoning.task_graph
+    --ice-changed "ice_ai/reasoning/task_graph.py ice_ai/llm/scoring.py"
+
+Selection is conservative: tests without any known dependency always run,
+and a changed path that is neither an ``ice_ai`` module nor a collected
+test file disables selection entirely.
+"""
+
+from __future__ import annotations
+
+import ast
+import importlib.util
+import json
+import sys
+import threading
+from functools import lru_cache
+from importlib.machinery import PathFinder
+from pathlib import Path
+
+import pytest
+
+
+PACKAGE = "ice_ai"
+
+IMPACT_PROPERTY = "ice_impact"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ice-impact", "ICE test-impact selection")
+    group.addoption(
+        "--ice-changed",
+        action="append",
+        default=[],
+        metavar="CHANGES",
+        help="Run only tests affected by these modules or paths "
+        "(repeatable, comma or whitespace separated).",
+    )
+    group.addoption(
+        "--ice-impact-record",
+        action="store_true",
+        default=False,
+        help="Record the ice_ai modules executed by each test.",
+    )
+
+
+# =========================
+# STATIC RESOLUTION
+# =========================
+
+@lru_cache(maxsize=None)
+def _spec(name: str):
+    """
+    Locates a module without importing it (or its parent packages).
+    """
+    parent, _, _ = name.rpartition(".")
+    if not parent:
+        # Top-level lookups never import anything, and honour
+        # meta-path finders such as editable installs.
+        return importlib.util.find_spec(name)
+
+    parent_spec = _spec(parent)
+    if parent_spec is None or not parent_spec.submodule_search_locations:
+        return None
+    return PathFinder.find_spec(name, list(parent_spec.submodule_search_locations))
+
+
+def module_source(name: str) -> Path | None:
+    """
+    Returns the source file of an ``ice_ai`` module, if it exists on disk.
+    """
+    spec = _spec(name)
+    if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+        return None
+    return Path(spec.origin)
+
+
+def _with_parents(name: str) -> set[str]:
+    parts = name.split(".")
+    return {".".join(parts[:i]) for i in range(1, len(parts) + 1)}
+
+
+def _is_ice_ai(name: str) -> bool:
+    return name == PACKAGE or name.startswith(PACKAGE + ".")
+
+
+def _imported_names(tree: ast.AST, package: str, accept=_is_ice_ai) -> set[str]:
+    """
+    Returns absolute module names imported by a syntax tree.
+
+    ``package`` is the package relative imports resolve against.
+    Only names for which ``accept(name)`` holds are returned
+    (``ice_ai`` modules by default).
+    """
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package.split(".")
+                base = base[: len(base) - (node.level - 1)]
+                if not base:
+                    continue
+                module = ".".join(base + ([node.module] if node.module else []))
+            else:
+                module = node.module or ""
+            names.add(module)
+            # ``from pkg import submodule`` imports the submodule too.
+            for alias in node.names:
+                candidate = f"{module}.{alias.name}"
+                if module and accept(module) and _spec(candidate) is not None:
+                    names.add(candidate)
+
+    return {name for name in names if name and accept(name)}
+
+
+def _parse(path: Path) -> ast.AST | None:
+    try:
+        return ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def module_dependencies(name: str) -> frozenset[str]:
+    """
+    Returns the transitive ``ice_ai`` import closure of a module.
+    """
+    seen = set()
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+
+        source = module_source(current)
+        if source is None:
+            continue
+        tree = _parse(source)
+        if tree is None:
+            continue
+
+        package = current if source.name == "__init__.py" else current.rpartition(".")[0]
+        for imported in _imported_names(tree, package):
+            pending.extend(_with_parents(imported) - seen)
+
+    return frozenset(seen)
+
+
+@lru_cache(maxsize=None)
+def static_dependencies(path: Path) -> frozenset[str]:
+    """
+    Returns the ``ice_ai`` modules a test file depends on through imports.
+    """
+    tree = _parse(path)
+    if tree is None:
+        return frozenset()
+
+    result = set()
+    for imported in _imported_names(tree, package=""):
+        for name in _with_parents(imported):
+            result |= module_dependencies(name)
+    return frozenset(result)
+
+
+def local_source(name: str, root: Path) -> Path | None:
+    """
+    Returns the source file of a module that lives in the ICE Tests tree
+    (helpers, plugins), or None for ``ice_ai``, stdlib and installed modules.
+    """
+    if not name or _is_ice_ai(name):
+        return None
+    try:
+        spec = _spec(name)
+    except (ImportError, ValueError):
+        # Modules without a spec (__main__) or unimportable parents.
+        return None
+    if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+        return None
+
+    origin = Path(spec.origin).resolve()
+    if root not in origin.parents or "site-packages" in origin.parts:
+        return None
+    return origin
+
+
+@lru_cache(maxsize=None)
+def local_dependencies(path: Path, root: Path) -> frozenset[Path]:
+    """
+    Returns the local sources a file imports, followed transitively.
+    """
+    def is_local(name):
+        return local_source(name, root) is not None
+
+    result = set()
+    pending = [path]
+    while pending:
+        tree = _parse(pending.pop())
+        if tree is None:
+            continue
+        for imported in _imported_names(tree, package="", accept=is_local):
+            for name in _with_parents(imported):
+                source = local_source(name, root)
+                if source is not None and source not in result:
+                    result.add(source)
+                    pending.append(source)
+    return frozenset(result)
+
+
+# =========================
+# CHANGE RESOLUTION
+# =========================
+
+def _split_changes(values) -> list[str]:
+    changes = []
+    for value in values:
+        changes.extend(part for part in value.replace(",", " ").split() if part)
+    return changes
+
+
+def changed_module(change: str) -> str | None:
+    """
+    Converts a module name or file path into an ``ice_ai`` module name.
+
+    A path that is not a ``.py`` file (package data, stubs, extension
+    modules, directories) maps to its containing package, so every test
+    depending on that package is selected.
+    """
+    if "/" not in change and "\\" not in change and not change.endswith(".py"):
+        return change if change.split(".")[0] == PACKAGE else None
+
+    parts = list(Path(change).parts)
+    if PACKAGE not in parts:
+        return None
+
+    parts = parts[len(parts) - 1 - parts[::-1].index(PACKAGE):]
+    if len(parts) > 1:
+        if parts[-1].endswith(".py"):
+            parts[-1] = parts[-1][:-3]
+        else:
+            parts.pop()
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def is_affected(dependencies, modules) -> bool:
+    """
+    True when a dependency is a changed module or lives inside a changed package.
+    """
+    for dependency in dependencies:
+        for module in modules:
+            if dependency == module or dependency.startswith(module + "."):
+                return True
+    return False
+
+
+# =========================
+# RECORDING
+# =========================
+
+def impact_path(config) -> Path | None:
+    if not hasattr(config, "cache"):
+        # -p no:cacheprovider: no impact map.
+        return None
+    return config.cache.mkdir("ice") / "impact.json"
+
+
+def load_impact_map(config) -> dict[str, list[str]]:
+    path = impact_path(config)
+    if path is None or not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+class ExecutionTracer:
+    """
+    Records the ``ice_ai`` modules executed while a test runs.
+
+    Uses ``sys.setprofile`` (function calls only), which is much cheaper
+    than line tracing and sufficient at module granularity.
+    ``threading.setprofile`` extends it to the threads the test starts,
+    e.g. thread-pool workers.
+    """
+
+    def __init__(self):
+        self.modules = set()
+
+    def _profile(self, frame, event, arg):
+        if event == "call":
+            name = frame.f_globals.get("__name__", "")
+            if _is_ice_ai(name):
+                self.modules.add(name)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        self.modules = set()
+        threading.setprofile(self._profile)
+        sys.setprofile(self._profile)
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item):
+        yield
+        sys.setprofile(None)
+        threading.setprofile(None)
+        # Attached before the teardown report is built, so xdist
+        # forwards it to the controller with the report.
+        item.user_properties.append((IMPACT_PROPERTY, sorted(self.modules)))
+
+
+class ImpactRecorder:
+    """
+    Collects recorded dependencies and merges them into the impact map.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.recorded = {}
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == IMPACT_PROPERTY:
+                self.recorded[report.nodeid] = value
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput") or not self.recorded:
+            return
+
+        impact = load_impact_map(self.config)
+        impact.update(self.recorded)
+        impact_path(self.config).write_text(
+            json.dumps(impact, indent=1, sort_keys=True), encoding="utf-8"
+        )
+
+
+# =========================
+# SELECTION
+# =========================
+
+def pytest_configure(config):
+    # -p no:cacheprovider leaves nowhere to store the impact map.
+    if config.getoption("ice_impact_record") and hasattr(config, "cache"):
+        config.pluginmanager.register(ExecutionTracer(), "ice-impact-tracer")
+        config.pluginmanager.register(ImpactRecorder(config), "ice-impact-recorder")
+
+
+def dependencies_of(item, impact) -> set[str]:
+    """
+    Returns every known ``ice_ai`` dependency of a collected test.
+    """
+    dependencies = set(static_dependencies(Path(item.path)))
+    dependencies.update(impact.get(item.nodeid, ()))
+    return dependencies
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    changes = _split_changes(config.getoption("ice_changed"))
+    if not changes:
+        return
+
+    test_files = {Path(item.path).resolve() for item in items}
+    modules = set()
+    files = set()
+    for change in changes:
+        module = changed_module(change)
+        if module is not None:
+            modules.add(module)
+            continue
+
+        path = (config.rootpath / change).resolve()
+        if path in test_files:
+            files.add(path)
+        else:
+            # Unknown impact (tooling, conftest, fixtures): run everything.
+            return
+
+    impact = load_impact_map(config)
+    selected = []
+    deselected = []
+    for item in items:
+        dependencies = dependencies_of(item, impact)
+        if (
+            not dependencies
+            or Path(item.path).resolve() in files
+            or is_affected(dependencies, modules)
+        ):
+            selected.append(item)
+        else:
+            deselected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
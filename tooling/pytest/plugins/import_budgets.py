@@ -0,0 +1,111 @@
+"""
+Import-time budget recording for ICE Tests.
+
+Import budgets are versioned under:
+
+    governance/regression/import_budgets.json
+
+Budget tests attach each measured cold import time to their report
+(``record_import_time``). With ``--ice-import-budgets-save``, budget
+tests stop enforcing the recorded budgets and the session rewrites them
+from the measurements: the best observed time with ``HEADROOM``, rounded
+up to ``GRANULARITY`` microseconds.
+
+Budgets are only meaningful on the machine class they were recorded on:
+record them on the CI benchmark runners (``ci_entrypoint.sh --benchmarks``).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+
+DEFAULT_BUDGETS = Path("governance") / "regression" / "import_budgets.json"
+
+SCHEMA_VERSION = 1
+
+IMPORT_TIME_PROPERTY = "ice_import_time"
+
+# Recorded budgets leave room for runner noise above the best measurement.
+HEADROOM = 1.5
+
+# Budgets are rounded up to this many microseconds.
+GRANULARITY = 1000
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ice-import-budgets", "ICE import-time budgets")
+    group.addoption(
+        "--ice-import-budgets-save",
+        action="store_true",
+        default=False,
+        help=f"Record measured import times as the new budgets in {DEFAULT_BUDGETS}.",
+    )
+
+
+def budget_for(measured_us: int) -> int:
+    """
+    Returns the budget recorded for a measured cold import time.
+    """
+    return math.ceil(measured_us * HEADROOM / GRANULARITY) * GRANULARITY
+
+
+def record_import_time(item, module: str, measured_us: int) -> None:
+    """
+    Attaches a measurement to a test report.
+
+    Forwarded with the report, so xdist workers reach the controller.
+    """
+    item.user_properties.append((IMPORT_TIME_PROPERTY, [module, measured_us]))
+
+
+def is_recording(config) -> bool:
+    return config.getoption("ice_import_budgets_save")
+
+
+class ImportBudgetRecorder:
+    """
+    Rewrites the budgets of every module measured during the session.
+
+    Modules that were not measured keep their budget: a partial run
+    never drops entries.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.measured: dict[str, int] = {}
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == IMPORT_TIME_PROPERTY:
+                module, measured_us = value
+                self.measured[module] = min(measured_us, self.measured.get(module, measured_us))
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput") or not self.measured:
+            return
+
+        path = self.config.rootpath / DEFAULT_BUDGETS
+        data = json.loads(path.read_text(encoding="utf-8"))
+        for module, measured_us in self.measured.items():
+            data["budgets"][module] = budget_for(measured_us)
+
+        path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.measured:
+            return
+        terminalreporter.section("ice import budgets")
+        for module, measured_us in sorted(self.measured.items()):
+            terminalreporter.write_line(
+                f"{module}: best {measured_us} us, budget {budget_for(measured_us)} us"
+            )
+
+
+def pytest_configure(config):
+    if is_recording(config):
+        config.pluginmanager.register(ImportBudgetRecorder(config), "ice-import-budgets")
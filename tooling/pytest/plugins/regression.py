@@ -0,0 +1,273 @@
+"""
+Statistical performance-regression gate for ICE Tests.
+
+Benchmark baselines are versioned under:
+
+    governance/regression/benchmarks.json
+
+With ``--ice-benchmark-compare``, every benchmark is compared against its
+baseline samples with a one-sided Mann-Whitney U test. A benchmark fails
+when both hold:
+
+- the slowdown is statistically significant (p < ``--ice-benchmark-alpha``)
+- the median slowed down by more than ``--ice-benchmark-min-slowdown``
+
+The second condition keeps tiny but consistent shifts from failing CI.
+Benchmarks without a baseline are never failed.
+
+``--ice-benchmark-save`` records the session results as the new baseline.
+Baselines are only meaningful on the machine class they were recorded on;
+the baseline file stores a description of that machine. Machines compare
+by class (``machine_class``), or by the explicit ``--ice-benchmark-machine``
+label when one was recorded. On another machine class, every benchmark
+with a baseline fails: the baseline must be recorded again.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from tooling.pytest.plugins.benchmark import SCHEMA_VERSION, machine_class, machine_info
+
+
+DEFAULT_BASELINE = Path("governance") / "regression" / "benchmarks.json"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ice-benchmark")
+    group.addoption(
+        "--ice-benchmark-compare",
+        action="store_true",
+        default=False,
+        help="Fail benchmarks that are significantly slower than their baseline.",
+    )
+    group.addoption(
+        "--ice-benchmark-save",
+        action="store_true",
+        default=False,
+        help="Record this session's benchmark results as the new baseline.",
+    )
+    group.addoption(
+        "--ice-benchmark-baseline",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help=f"Baseline file (default: {DEFAULT_BASELINE}).",
+    )
+    group.addoption(
+        "--ice-benchmark-alpha",
+        action="store",
+        type=float,
+        default=0.01,
+        help="Significance level of the regression test (default: 0.01).",
+    )
+    group.addoption(
+        "--ice-benchmark-min-slowdown",
+        action="store",
+        type=float,
+        default=0.05,
+        help="Minimum relative median slowdown to fail (default: 0.05).",
+    )
+    group.addoption(
+        "--ice-benchmark-machine",
+        action="store",
+        default=None,
+        metavar="LABEL",
+        help="Machine class label recorded with, and compared against, the baseline.",
+    )
+
+
+# =========================
+# STATISTICS
+# =========================
+
+def mann_whitney_greater(baseline, current) -> float:
+    """
+    One-sided Mann-Whitney U test.
+
+    Returns the p-value of the hypothesis that ``current`` samples are
+    stochastically greater (slower) than ``baseline`` samples.
+    Uses the normal approximation with tie and continuity corrections,
+    which is accurate for the round counts benchmarks use (>= 8).
+    """
+    n1 = len(current)
+    n2 = len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    pooled = sorted(
+        [(value, 0) for value in current] + [(value, 1) for value in baseline]
+    )
+
+    # Average ranks across ties.
+    rank_sum = 0.0
+    tie_term = 0.0
+    i = 0
+    n = len(pooled)
+    while i < n:
+        j = i
+        while j + 1 < n and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        rank_sum += rank * sum(1 for k in range(i, j + 1) if pooled[k][1] == 0)
+        i = j + 1
+
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+# =========================
+# BASELINES
+# =========================
+
+def baseline_path(config) -> Path:
+    explicit = config.getoption("ice_benchmark_baseline")
+    if explicit:
+        return Path(explicit)
+    return config.rootpath / DEFAULT_BASELINE
+
+
+def load_baseline_file(path: Path) -> dict:
+    """
+    Returns the whole baseline document, or {} if it is missing or stale.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("schema_version") != SCHEMA_VERSION:
+        return {}
+    return data
+
+
+def load_baseline(path: Path) -> dict:
+    return load_baseline_file(path).get("benchmarks", {})
+
+
+def _ice_ai_version():
+    try:
+        from ice_ai.version import ICE_AI_VERSION
+    except ImportError:
+        return None
+    return ICE_AI_VERSION
+
+
+class RegressionGate:
+    """
+    Compares benchmark statistics against their recorded baseline.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.path = baseline_path(config)
+        data = load_baseline_file(self.path)
+        self.baseline = data.get("benchmarks", {})
+        self.machine = data.get("machine")
+        self.current = machine_info(config.getoption("ice_benchmark_machine"))
+        self.same_machine = not self.machine or (
+            machine_class(self.machine) == machine_class(self.current)
+        )
+        self.alpha = config.getoption("ice_benchmark_alpha")
+        self.min_slowdown = config.getoption("ice_benchmark_min_slowdown")
+
+    def check(self, name, stats) -> None:
+        """
+        Fails the running test if ``stats`` regressed against the baseline.
+
+        Timings from another machine class are not comparable: there,
+        every benchmark with a baseline fails instead of passing unchecked.
+        """
+        reference = self.baseline.get(name)
+        if not reference or not reference.get("samples"):
+            return
+
+        if not self.same_machine:
+            pytest.fail(
+                f"cannot compare {name}: {self.path.name} was recorded on "
+                f"{machine_class(self.machine)}, this machine is "
+                f"{machine_class(self.current)}; record the baseline again",
+                pytrace=False,
+            )
+
+        baseline_median = reference["median"]
+        slowdown = stats.median / baseline_median - 1 if baseline_median else 0.0
+        p_value = mann_whitney_greater(reference["samples"], stats.samples)
+
+        if p_value < self.alpha and slowdown > self.min_slowdown:
+            pytest.fail(
+                f"performance regression in {name}: median "
+                f"{stats.median * 1e6:.3f} us vs baseline {baseline_median * 1e6:.3f} us "
+                f"(+{slowdown:.1%}, Mann-Whitney p={p_value:.2g} < {self.alpha})",
+                pytrace=False,
+            )
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.same_machine or not self.baseline:
+            return
+        terminalreporter.write_line(
+            f"ice regression gate: {self.path.name} was recorded on another machine "
+            f"class ({machine_class(self.machine)}); benchmarks with a baseline failed",
+            red=True,
+        )
+
+
+class BaselineRecorder:
+    """
+    Merges the session's benchmark results into the baseline file.
+    """
+
+    def __init__(self, config):
+        self.config = config
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput"):
+            return
+
+        results = self.config.pluginmanager.get_plugin("ice-benchmark-results")
+        if results is None or not results.results:
+            return
+
+        path = baseline_path(self.config)
+        benchmarks = load_baseline(path)
+        for name, stats in results.results.items():
+            benchmarks[name] = {
+                "median": stats["median"],
+                "iqr": stats["iqr"],
+                "iterations": stats["iterations"],
+                "samples": stats["samples"],
+            }
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(
+                {
+                    "schema_version": SCHEMA_VERSION,
+                    "ice_ai_version": _ice_ai_version(),
+                    "machine": machine_info(self.config.getoption("ice_benchmark_machine")),
+                    "benchmarks": benchmarks,
+                },
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+
+def pytest_configure(config):
+    if config.getoption("ice_benchmark_compare"):
+        config.pluginmanager.register(RegressionGate(config), "ice-regression-gate")
+    if config.getoption("ice_benchmark_save"):
+        config.pluginmanager.register(BaselineRecorder(config), "ice-baseline-recorder")
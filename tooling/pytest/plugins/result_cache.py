@@ -0,0 +1,231 @@
+"""
+Content-addressed result cache for pure ICE tests.
+
+Unit tests are pure by definition (no IO, no environment) and contract
+tests are pure structural checks. Their outcome is therefore a function
+of their code: the test file, the local modules and conftests it runs
+with, and the ``ice_ai`` modules it touches.
+
+With ``--ice-result-cache``, every passing unit or contract test stores
+a key derived from:
+
+- its nodeid
+- the bytes of its test file
+- the source of every local module it imports, transitively
+  (``tooling.helpers`` and other modules of this tree)
+- every ``conftest.py`` from the rootdir down to the test file,
+  with their local imports
+- every source under ``tooling/pytest/`` (markers, plugins)
+- the source of every ``ice_ai`` module it depends on
+  (see ``tooling.pytest.plugins.impact``)
+- the Python version
+
+Benchmarks and slow tests are never cached, nor is any test using the
+``benchmark`` fixture: they measure the machine, and the regression gate
+must see them run.
+
+A test whose key is already stored is reported as a cached pass and
+not executed. Entries are empty files named by their key under
+``.pytest_cache/d/ice/results/``: the cache is local, safe to wipe
+(``--cache-clear``), and safe for concurrent xdist workers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+from _pytest.reports import TestReport
+
+from tooling.pytest.plugins.impact import (
+    dependencies_of,
+    load_impact_map,
+    local_dependencies,
+    module_source,
+)
+
+
+PURE_LEVELS = {"unit", "contract"}
+
+# Measurements: their outcome depends on the machine, not only on code.
+UNCACHEABLE_MARKERS = {"benchmark", "slow"}
+
+TOOLING = Path("tooling") / "pytest"
+
+CACHED_PROPERTY = "ice_cached"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ice-result-cache", "ICE result cache")
+    group.addoption(
+        "--ice-result-cache",
+        action="store_true",
+        default=False,
+        help="Skip unit and contract tests whose code is unchanged since they last passed.",
+    )
+
+
+# =========================
+# KEYS
+# =========================
+
+def _file_digest(path: Path, digests: dict) -> bytes:
+    digest = digests.get(path)
+    if digest is None:
+        try:
+            digest = hashlib.sha256(path.read_bytes()).digest()
+        except OSError:
+            digest = b"missing"
+        digests[path] = digest
+    return digest
+
+
+def _tooling_digest(root: Path, digests: dict) -> bytes:
+    digest = digests.get(TOOLING)
+    if digest is None:
+        combined = hashlib.sha256()
+        for path in sorted((root / TOOLING).rglob("*.py")):
+            combined.update(str(path.relative_to(root)).encode("utf-8"))
+            combined.update(_file_digest(path, digests))
+        digest = digests[TOOLING] = combined.digest()
+    return digest
+
+
+def _conftests(path: Path, root: Path) -> list[Path]:
+    """
+    Returns the conftest.py files that apply to a test file, rootdir first.
+    """
+    found = []
+    for directory in path.parents:
+        candidate = directory / "conftest.py"
+        if candidate.is_file():
+            found.append(candidate)
+        if directory == root:
+            break
+    return found[::-1]
+
+
+@lru_cache(maxsize=None)
+def _local_sources(path: Path, root: Path) -> tuple[Path, ...]:
+    sources = set()
+    for source in [path, *_conftests(path, root)]:
+        if source != path:
+            sources.add(source)
+        sources |= local_dependencies(source, root)
+    sources.discard(path)
+    return tuple(sorted(sources))
+
+
+def result_key(item, impact, digests) -> str | None:
+    """
+    Returns the cache key of a pure test, or None if the test is not pure.
+    """
+    names = {m.name for m in item.iter_markers()}
+    if not names & PURE_LEVELS or names & UNCACHEABLE_MARKERS:
+        return None
+    if "benchmark" in getattr(item, "fixturenames", ()):
+        return None
+
+    root = item.config.rootpath.resolve()
+    path = Path(item.path).resolve()
+
+    key = hashlib.sha256()
+    key.update(item.nodeid.encode("utf-8"))
+    key.update(sys.version.encode("utf-8"))
+    key.update(_file_digest(path, digests))
+    key.update(_tooling_digest(root, digests))
+
+    for source in _local_sources(path, root):
+        key.update(str(source).encode("utf-8"))
+        key.update(_file_digest(source, digests))
+
+    for module in sorted(dependencies_of(item, impact)):
+        source = module_source(module)
+        key.update(module.encode("utf-8"))
+        if source is not None:
+            key.update(_file_digest(source, digests))
+
+    return key.hexdigest()
+
+
+# =========================
+# PLUGIN
+# =========================
+
+class ResultCache:
+    """
+    Reports unchanged pure tests as cached passes and stores new passes.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.directory = config.cache.mkdir("ice") / "results"
+        self.directory.mkdir(exist_ok=True)
+        self.keys = {}
+        self.failed = set()
+        self.cached = 0
+
+    def pytest_collection_modifyitems(self, config, items):
+        impact = load_impact_map(config)
+        digests = {}
+        for item in items:
+            key = result_key(item, impact, digests)
+            if key is not None:
+                self.keys[item.nodeid] = key
+
+    def _is_cached(self, item) -> bool:
+        key = self.keys.get(item.nodeid)
+        return key is not None and (self.directory / key).exists()
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if not self._is_cached(item):
+            return None
+
+        ihook = item.ihook
+        ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        for when in ("setup", "call", "teardown"):
+            report = TestReport(
+                nodeid=item.nodeid,
+                location=item.location,
+                keywords={name: 1 for name in item.keywords},
+                outcome="passed",
+                longrepr=None,
+                when=when,
+                user_properties=[(CACHED_PROPERTY, True)],
+            )
+            ihook.pytest_runtest_logreport(report=report)
+        # The previous test kept the fixtures this one would have shared
+        # with it: tear down what the real next test does not need, as
+        # the skipped runtestprotocol would have done.
+        item.session._setupstate.teardown_exact(nextitem)
+        ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    def pytest_runtest_logreport(self, report):
+        if (CACHED_PROPERTY, True) in report.user_properties:
+            if report.when == "call":
+                self.cached += 1
+            return
+
+        if not report.passed:
+            self.failed.add(report.nodeid)
+        elif report.when == "teardown" and report.nodeid not in self.failed:
+            key = self.keys.get(report.nodeid)
+            if key is not None:
+                (self.directory / key).touch()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.cached:
+            terminalreporter.write_line(
+                f"ice result cache: {self.cached} pure tests reported from cache"
+            )
+
+
+def pytest_configure(config):
+    # -p no:cacheprovider leaves nowhere to store results: run every test.
+    if config.getoption("ice_result_cache") and hasattr(config, "cache"):
+        config.pluginmanager.register(ResultCache(config), "ice-result-cache")
@@ -0,0 +1,96 @@
+"""
+Duration-aware test scheduling for ICE Tests.
+
+This plugin reorders the collected suite so that parallel workers
+(pytest-xdist, ``--dist load``) are fed in a predictable order:
+
+- tests are grouped by LEVEL marker, cheapest level first
+- inside a level, tests run longest-first (LPT) using the duration
+  history recorded by ``tooling.pytest.plugins.durations``
+
+Cheap unit and contract tests therefore never queue behind slow e2e ones,
+and long tests start early instead of becoming the tail of the run.
+
+The plugin is opt-in (``--ice-schedule``).
+It never selects or deselects tests: it only changes their order.
+"""
+
+from __future__ import annotations
+
+import statistics
+
+import pytest
+
+from tooling.pytest.plugins.durations import load_history
+
+
+# =========================
+# LEVEL ORDERING
+# =========================
+
+# Cheapest level first. Unknown levels are scheduled last.
+LEVEL_PRIORITY = ("unit", "contract", "integration", "scenario", "e2e")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ice-schedule", "ICE duration-aware scheduling")
+    group.addoption(
+        "--ice-schedule",
+        action="store_true",
+        default=False,
+        help="Order tests by LEVEL marker, then longest-first by recorded duration.",
+    )
+
+
+# =========================
+# ORDERING
+# =========================
+
+def level_of(item) -> int:
+    """
+    Returns the scheduling rank of an item's LEVEL marker.
+    """
+    names = {m.name for m in item.iter_markers()}
+    for rank, level in enumerate(LEVEL_PRIORITY):
+        if level in names:
+            return rank
+    return len(LEVEL_PRIORITY)
+
+
+def schedule(items, durations):
+    """
+    Returns items ordered by level rank, then by descending duration.
+
+    Tests without history are estimated with the median duration
+    of their level, so they neither starve nor jump the queue.
+    Ties keep collection order, which keeps the order deterministic
+    across xdist workers.
+    """
+    ranks = [level_of(item) for item in items]
+
+    known_by_rank = {}
+    for item, rank in zip(items, ranks):
+        if item.nodeid in durations:
+            known_by_rank.setdefault(rank, []).append(durations[item.nodeid])
+
+    fallback = {
+        rank: statistics.median(values)
+        for rank, values in known_by_rank.items()
+    }
+
+    def sort_key(indexed):
+        index, (item, rank) = indexed
+        estimate = durations.get(item.nodeid, fallback.get(rank, 0.0))
+        return (rank, -estimate, index)
+
+    ordered = sorted(enumerate(zip(items, ranks)), key=sort_key)
+    return [item for _, (item, _) in ordered]
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("ice_schedule"):
+        return
+
+    durations = load_history(config).estimates()
+    items[:] = schedule(items, durations)
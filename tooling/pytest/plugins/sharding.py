@@ -0,0 +1,124 @@
+"""
+Deterministic duration-balanced sharding for ICE Tests.
+
+``--shard i/N`` keeps only the tests assigned to shard ``i`` (1-based)
+out of ``N``. Every machine computes the same assignment from the same
+inputs, so shards never overlap and never miss a test:
+
+- tests without history are pinned to a shard by a stable hash of
+  their nodeid, and weigh on it as the median known duration
+- tests with history are bin-packed greedily, longest first, onto the
+  currently lightest shard (LPT)
+
+A new test never moves tests without history, but its weight can move
+tests with history to other shards.
+
+Every machine must read the same duration history, so sharding only
+uses an explicit one (``--ice-durations`` / ``ICE_DURATIONS``). Without
+it, each machine would read its own pytest cache and shards could
+overlap or miss tests: every test is then pinned by hash alone.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import statistics
+
+import pytest
+
+from tooling.pytest.plugins.durations import load_history
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ice-shard", "ICE CI sharding")
+    group.addoption(
+        "--shard",
+        action="store",
+        default=None,
+        metavar="I/N",
+        help="Run only shard I of N (1-based), balanced by recorded durations.",
+    )
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """
+    Parses ``"i/N"`` into a zero-based shard index and a shard count.
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--shard expects I/N, got {value!r}") from None
+
+    if count < 1 or not 1 <= index <= count:
+        raise pytest.UsageError(f"--shard {value!r} is out of range")
+
+    return index - 1, count
+
+
+def stable_bucket(nodeid: str, count: int) -> int:
+    """
+    Returns a shard for a nodeid that is stable across runs and machines.
+    """
+    digest = hashlib.sha1(nodeid.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count
+
+
+def assign_shards(nodeids, durations, count: int) -> dict[str, int]:
+    """
+    Assigns every nodeid to a shard in ``range(count)``.
+    """
+    known = [nodeid for nodeid in nodeids if nodeid in durations]
+    unknown = [nodeid for nodeid in nodeids if nodeid not in durations]
+
+    estimate = statistics.median(durations[n] for n in known) if known else 0.0
+    loads = [0.0] * count
+    assignment = {}
+
+    for nodeid in unknown:
+        shard = stable_bucket(nodeid, count)
+        assignment[nodeid] = shard
+        loads[shard] += estimate
+
+    heap = [(load, shard) for shard, load in enumerate(loads)]
+    heapq.heapify(heap)
+    for nodeid in sorted(known, key=lambda n: (-durations[n], n)):
+        load, shard = heapq.heappop(heap)
+        assignment[nodeid] = shard
+        heapq.heappush(heap, (load + durations[nodeid], shard))
+
+    return assignment
+
+
+def pytest_configure(config):
+    value = config.getoption("shard")
+    if value:
+        # Fail before collection on malformed input.
+        parse_shard(value)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    value = config.getoption("shard")
+    if not value:
+        return
+
+    index, count = parse_shard(value)
+    if config.getoption("ice_durations"):
+        durations = load_history(config).estimates()
+    else:
+        # Local caches differ between machines: hash-only assignment.
+        durations = {}
+    assignment = assign_shards([item.nodeid for item in items], durations, count)
+
+    selected = []
+    deselected = []
+    for item in items:
+        if assignment[item.nodeid] == index:
+            selected.append(item)
+        else:
+            deselected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
@@ -0,0 +1,87 @@
+"""
+Marker validation for ICE Tests.
+
+Every collected test must carry at least one LEVEL marker and one
+SCOPE marker (see markers.py).
+
+Validation is a single pass over the collected items:
+- marker names are resolved once per collection node (package, module,
+  class) and reused by every item below it, so module-level
+  ``pytestmark`` is read once per module, not once per test
+- every violation is collected, then reported together
+
+Cost is linear in the number of items and does not depend on how many
+markers each node carries.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from tooling.pytest.markers import LEVEL_MARKERS, SCOPE_MARKERS
+
+
+@dataclass(frozen=True)
+class MarkerViolation:
+    nodeid: str
+    category: str
+    allowed: tuple[str, ...]
+
+    def describe(self) -> str:
+        return f"{self.nodeid}: no {self.category} marker (one of {list(self.allowed)})"
+
+
+class MarkerValidator:
+    """
+    Resolves marker names per collection node and validates items.
+    """
+
+    def __init__(self, level_markers=LEVEL_MARKERS, scope_markers=SCOPE_MARKERS):
+        self.level_markers = frozenset(level_markers)
+        self.scope_markers = frozenset(scope_markers)
+        self._resolved = {}
+
+    def marker_names(self, node) -> frozenset[str]:
+        """
+        Returns the marker names applying to a node, including inherited ones.
+        """
+        if node is None:
+            return frozenset()
+
+        names = self._resolved.get(node)
+        if names is None:
+            own = frozenset(mark.name for mark in node.own_markers)
+            inherited = self.marker_names(node.parent)
+            names = own | inherited if own else inherited
+            self._resolved[node] = names
+        return names
+
+    def validate(self, items) -> list[MarkerViolation]:
+        """
+        Returns every marker violation among the items, in collection order.
+        """
+        levels = tuple(sorted(self.level_markers))
+        scopes = tuple(sorted(self.scope_markers))
+        violations = []
+
+        for item in items:
+            # Items are leaves: their own markers are never reused.
+            names = self.marker_names(item.parent)
+            if item.own_markers:
+                names = names | {mark.name for mark in item.own_markers}
+
+            if names.isdisjoint(self.level_markers):
+                violations.append(MarkerViolation(item.nodeid, "LEVEL", levels))
+            if names.isdisjoint(self.scope_markers):
+                violations.append(MarkerViolation(item.nodeid, "SCOPE", scopes))
+
+        return violations
+
+
+def format_violations(violations) -> str:
+    """
+    Renders all violations as a single report.
+    """
+    lines = [f"{len(violations)} marker violation(s):"]
+    lines.extend(f"  - {violation.describe()}" for violation in violations)
+    return "\n".join(lines)
@@ -0,0 +1,65 @@
+import pytest
+
+
+pytest_plugins = ["pytester"]
+
+
+MODULE = """
+import pytest
+
+
+@pytest.mark.integration
+@pytest.mark.domain
+def test_a():
+    pass
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_b():
+    pass
+"""
+
+
+def run(pytester, *args):
+    return pytester.runpytest_inprocess(
+        "-p", "tooling.pytest.conftest", "-p", "no:randomly", "--ice-collect-cache", *args
+    )
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — PARTIAL COLLECTIONS
+# ---------------------------------------------------------------------
+
+@pytest.mark.integration
+@pytest.mark.core
+@pytest.mark.parametrize("partial", [["test_m.py::test_a"], ["--lf"]], ids=["nodeid", "lf"])
+def test_collection_manifest_partial_runs_never_hide_tests(pytester, partial):
+    """
+    Invariant:
+    After a partial collection, a marker selection still runs every
+    matching test of the file.
+    """
+
+    pytester.makepyfile(test_m=MODULE)
+
+    run(pytester).assert_outcomes(passed=2)
+    run(pytester, *partial)
+
+    run(pytester, "-m", "unit").assert_outcomes(passed=1, deselected=1)
+
+
+@pytest.mark.integration
+@pytest.mark.core
+def test_collection_manifest_skips_files_that_cannot_match(pytester):
+    """
+    Invariant:
+    An unchanged file without a matching test is not collected.
+    """
+
+    pytester.makepyfile(test_m=MODULE)
+
+    run(pytester).assert_outcomes(passed=2)
+    result = run(pytester, "-m", "e2e")
+
+    result.stdout.fnmatch_lines(["*ice collection manifest: 1 unchanged files not collected*"])
@@ -0,0 +1,83 @@
+import pytest
+
+from tooling.pytest.plugins.durations import SMOOTHING, DurationStats
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — ROLLING STATISTICS
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_duration_stats_first_sample_sets_the_means():
+    """
+    Invariant:
+    The first sample is taken as is; missing phases count as 0.
+    """
+
+    stats = DurationStats()
+
+    stats.add({"setup": 0.1, "call": 1.0})
+
+    assert (stats.setup, stats.call, stats.teardown) == (0.1, 1.0, 0.0)
+    assert stats.count == 1
+    assert stats.total == pytest.approx(1.1)
+    assert stats.worst == pytest.approx(1.1)
+
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_duration_stats_later_samples_are_smoothed():
+    """
+    Invariant:
+    Later samples move each mean by SMOOTHING towards the sample.
+    """
+
+    stats = DurationStats()
+    stats.add({"call": 1.0})
+
+    stats.add({"call": 2.0})
+
+    assert stats.call == pytest.approx(1.0 + SMOOTHING * (2.0 - 1.0))
+    assert stats.count == 2
+    assert stats.worst == 2.0
+
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_duration_stats_compacted_records_weigh_their_count():
+    """
+    Invariant:
+    A compacted record counts as ``count`` samples, with a weight
+    capped at 1, and keeps its recorded worst case.
+    """
+
+    stats = DurationStats()
+    stats.add({"call": 1.0})
+
+    stats.add({"call": 3.0, "count": 2, "worst": 5.0})
+    assert stats.call == pytest.approx(1.0 + min(1.0, 2 * SMOOTHING) * 2.0)
+    assert stats.count == 3
+    assert stats.worst == 5.0
+
+    stats.add({"call": 4.0, "count": 10})
+    assert stats.call == 4.0
+    assert stats.count == 13
+
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_duration_stats_round_trip_through_records():
+    """
+    Invariant:
+    A record folded into empty stats reproduces the same record.
+    """
+
+    stats = DurationStats()
+    stats.add({"setup": 0.1, "call": 1.0, "teardown": 0.2})
+    record = stats.to_record("test_a")
+
+    restored = DurationStats()
+    restored.add(record)
+
+    assert restored.to_record("test_a") == record
@@ -0,0 +1,71 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from tooling.pytest.plugins.impact import IMPACT_PROPERTY, ExecutionTracer
+
+
+def function_in(module):
+    """
+    Returns a function whose frames report ``module`` as their module.
+    """
+    namespace = {"__name__": module}
+    exec("def run():\n    return None\n", namespace)
+    return namespace["run"]
+
+
+def traced(tracer, body):
+    """
+    Runs ``body`` between the tracer's setup and teardown hooks and
+    returns the recorded modules.
+    """
+    item = SimpleNamespace(user_properties=[])
+    for hook in (tracer.pytest_runtest_setup, tracer.pytest_runtest_teardown):
+        wrapper = hook(item)
+        next(wrapper)
+        if hook == tracer.pytest_runtest_setup:
+            body()
+        with pytest.raises(StopIteration):
+            next(wrapper)
+    return dict(item.user_properties)[IMPACT_PROPERTY]
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — EXECUTION TRACING
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_execution_tracer_records_threads_started_by_the_test():
+    """
+    Invariant:
+    ice_ai code run by a thread the test starts is recorded.
+    """
+
+    run = function_in("ice_ai.reasoning.task_graph")
+
+    def body():
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+
+    assert traced(ExecutionTracer(), body) == ["ice_ai.reasoning.task_graph"]
+
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_execution_tracer_ignores_packages_sharing_the_prefix():
+    """
+    Invariant:
+    Only ice_ai and its submodules are recorded, not ice_ai_* packages.
+    """
+
+    lookalike = function_in("ice_ai_extensions.plugin")
+    package = function_in("ice_ai")
+
+    def body():
+        lookalike()
+        package()
+
+    assert traced(ExecutionTracer(), body) == ["ice_ai"]
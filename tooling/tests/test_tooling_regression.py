@@ -0,0 +1,170 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from tooling.pytest.plugins.benchmark import SCHEMA_VERSION, machine_class, machine_info
+from tooling.pytest.plugins.regression import RegressionGate, mann_whitney_greater
+
+
+class FakeConfig:
+    def __init__(self, rootpath, **options):
+        self.rootpath = rootpath
+        self.options = {
+            "ice_benchmark_baseline": None,
+            "ice_benchmark_alpha": 0.01,
+            "ice_benchmark_min_slowdown": 0.05,
+            "ice_benchmark_machine": None,
+            **options,
+        }
+
+    def getoption(self, name):
+        return self.options[name]
+
+
+def write_baseline(path, machine, samples):
+    path.write_text(
+        json.dumps(
+            {
+                "schema_version": SCHEMA_VERSION,
+                "machine": machine,
+                "benchmarks": {
+                    "bench": {
+                        "median": sorted(samples)[len(samples) // 2],
+                        "iqr": 0.0,
+                        "iterations": 1,
+                        "samples": samples,
+                    }
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+BASELINE_SAMPLES = [1.0, 1.01, 0.99, 1.02, 0.98, 1.0, 1.01, 0.99]
+SLOWER = SimpleNamespace(median=2.0, samples=[2.0, 2.01, 1.99, 2.02, 1.98, 2.0, 2.01, 1.99])
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — MANN-WHITNEY U
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.parametrize(
+    "baseline, current, expected",
+    [
+        # Fully separated: U = 16, z = 7.5 / sqrt(12).
+        ([1, 2, 3, 4], [5, 6, 7, 8], 0.0151914),
+        # Reversed: U = 0, z = -8.5 / sqrt(12).
+        ([5, 6, 7, 8], [1, 2, 3, 4], 0.9929310),
+        # Ties across samples: U = 23.5, tie-corrected variance 28.7727.
+        ([1, 2, 2, 3, 4], [2, 3, 3, 4, 5, 6], 0.0679259),
+    ],
+)
+def test_mann_whitney_greater_matches_hand_computed_p_values(baseline, current, expected):
+    """
+    Invariant:
+    p-values follow the normal approximation with tie and continuity
+    corrections.
+    """
+
+    assert mann_whitney_greater(baseline, current) == pytest.approx(expected, rel=1e-5)
+
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_mann_whitney_greater_without_samples_is_not_significant():
+    """
+    Invariant:
+    Empty samples or identical constant samples never report a slowdown.
+    """
+
+    assert mann_whitney_greater([], [1.0]) == 1.0
+    assert mann_whitney_greater([1.0], []) == 1.0
+    assert mann_whitney_greater([1.0, 1.0], [1.0, 1.0]) == 1.0
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — GATE
+# ---------------------------------------------------------------------
+
+@pytest.mark.integration
+@pytest.mark.core
+def test_regression_gate_fails_significant_slowdown_on_same_machine(tmp_path):
+    """
+    Invariant:
+    A significant slowdown against a baseline recorded on this
+    machine fails the benchmark.
+    """
+
+    write_baseline(tmp_path / "baseline.json", machine_info(), BASELINE_SAMPLES)
+    gate = RegressionGate(
+        FakeConfig(tmp_path, ice_benchmark_baseline=str(tmp_path / "baseline.json"))
+    )
+
+    with pytest.raises(pytest.fail.Exception, match="performance regression in bench"):
+        gate.check("bench", SLOWER)
+
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_machine_class_ignores_image_updates():
+    """
+    Invariant:
+    OS builds and Python patch versions do not change the machine
+    class; an explicit label replaces the whole key.
+    """
+
+    info = machine_info()
+    updated = {**info, "platform": "Linux-0.0-other", "python": info["python"] + "9"}
+
+    assert machine_class(updated) == machine_class(info)
+    assert machine_class({**info, "cpu_count": -1}) != machine_class(info)
+    assert machine_class(machine_info("ci-bench")) == {"label": "ci-bench"}
+
+
+@pytest.mark.integration
+@pytest.mark.core
+def test_regression_gate_fails_baselines_from_another_machine(tmp_path):
+    """
+    Invariant:
+    Timings recorded on a different machine class are never compared,
+    and the benchmark fails instead of passing unchecked.
+    """
+
+    other = {**machine_info(), "cpu_count": -1}
+    write_baseline(tmp_path / "baseline.json", other, BASELINE_SAMPLES)
+    gate = RegressionGate(
+        FakeConfig(tmp_path, ice_benchmark_baseline=str(tmp_path / "baseline.json"))
+    )
+
+    assert gate.same_machine is False
+    with pytest.raises(pytest.fail.Exception, match="cannot compare bench"):
+        gate.check("bench", SimpleNamespace(median=1.0, samples=BASELINE_SAMPLES))
+    gate.check("unknown", SLOWER)
+
+
+@pytest.mark.integration
+@pytest.mark.core
+def test_regression_gate_compares_by_machine_label(tmp_path):
+    """
+    Invariant:
+    A baseline recorded with a label is compared on any machine
+    running with the same label.
+    """
+
+    labelled = {**machine_info("ci-bench"), "cpu_count": -1}
+    write_baseline(tmp_path / "baseline.json", labelled, BASELINE_SAMPLES)
+    gate = RegressionGate(
+        FakeConfig(
+            tmp_path,
+            ice_benchmark_baseline=str(tmp_path / "baseline.json"),
+            ice_benchmark_machine="ci-bench",
+        )
+    )
+
+    assert gate.same_machine is True
+    with pytest.raises(pytest.fail.Exception, match="performance regression in bench"):
+        gate.check("bench", SLOWER)
@@ -0,0 +1,69 @@
+import pytest
+
+
+pytest_plugins = ["pytester"]
+
+
+MODULE_X = """
+import pytest
+
+TORN_DOWN = []
+
+
+@pytest.fixture(scope="module")
+def resource():
+    yield "x"
+    TORN_DOWN.append("x")
+
+
+@pytest.mark.integration
+@pytest.mark.domain
+def test_impure(resource):
+    assert resource == "x"
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+def test_pure():
+    assert True
+"""
+
+MODULE_Y = """
+import pytest
+
+
+@pytest.mark.integration
+@pytest.mark.domain
+def test_other():
+    import test_x
+
+    assert test_x.TORN_DOWN == ["x"]
+"""
+
+
+def run(pytester):
+    return pytester.runpytest_inprocess(
+        "-p", "tooling.pytest.conftest", "-p", "no:randomly", "--ice-result-cache"
+    )
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — SETUP STATE
+# ---------------------------------------------------------------------
+
+@pytest.mark.integration
+@pytest.mark.core
+def test_result_cache_tears_down_fixtures_around_cached_tests(pytester):
+    """
+    Invariant:
+    A cached test still ends its predecessor's fixtures: module fixtures
+    are torn down before the next module runs.
+    """
+
+    pytester.makepyfile(test_x=MODULE_X, test_y=MODULE_Y)
+
+    run(pytester).assert_outcomes(passed=3)
+    result = run(pytester)
+
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(["*ice result cache: 1 pure tests reported from cache*"])
@@ -0,0 +1,113 @@
+import random
+
+import pytest
+
+from tooling.pytest.plugins.sharding import assign_shards, parse_shard, stable_bucket
+
+
+def nodeids(count):
+    return [f"domains/x/test_x.py::test_{idx}" for idx in range(count)]
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — ASSIGNMENT
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_assign_shards_covers_every_test_once():
+    """
+    Invariant:
+    Every nodeid gets exactly one shard in range(count).
+    """
+
+    ids = nodeids(100)
+    durations = {nodeid: 1.0 for nodeid in ids[:50]}
+
+    assignment = assign_shards(ids, durations, 4)
+
+    assert set(assignment) == set(ids)
+    assert set(assignment.values()) <= {0, 1, 2, 3}
+
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_assign_shards_is_deterministic_and_order_independent():
+    """
+    Invariant:
+    The same inputs give the same assignment on every machine,
+    whatever the collection order.
+    """
+
+    ids = nodeids(100)
+    rng = random.Random(0)
+    durations = {nodeid: rng.uniform(0.01, 2.0) for nodeid in ids[:70]}
+    shuffled = ids[:]
+    rng.shuffle(shuffled)
+
+    assert assign_shards(ids, durations, 3) == assign_shards(shuffled, dict(durations), 3)
+
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_assign_shards_balances_known_durations():
+    """
+    Invariant:
+    LPT bin-packing leaves shard loads at most one test apart: the
+    spread never exceeds the longest duration.
+    """
+
+    ids = nodeids(200)
+    rng = random.Random(0)
+    durations = {nodeid: rng.expovariate(1.0) for nodeid in ids}
+
+    assignment = assign_shards(ids, durations, 4)
+
+    loads = [0.0] * 4
+    for nodeid, shard in assignment.items():
+        loads[shard] += durations[nodeid]
+    assert max(loads) - min(loads) <= max(durations.values())
+
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_assign_shards_pins_unknown_tests_by_hash():
+    """
+    Invariant:
+    Without history, a test lands on its stable hash bucket.
+    """
+
+    ids = nodeids(50)
+
+    assignment = assign_shards(ids, {}, 5)
+
+    assert assignment == {nodeid: stable_bucket(nodeid, 5) for nodeid in ids}
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — OPTION PARSING
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_parse_shard_is_one_based():
+    """
+    Invariant:
+    "I/N" is parsed into a zero-based index and a count.
+    """
+
+    assert parse_shard("1/4") == (0, 4)
+    assert parse_shard("4/4") == (3, 4)
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.parametrize("value", ["0/4", "5/4", "1/0", "a/b", "1", "1/2/3"])
+def test_parse_shard_rejects_invalid_values(value):
+    """
+    Invariant:
+    Malformed or out-of-range shards are usage errors.
+    """
+
+    with pytest.raises(pytest.UsageError):
+        parse_shard(value)
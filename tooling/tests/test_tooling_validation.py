@@ -0,0 +1,111 @@
+import pytest
+
+from tooling.pytest.validation import MarkerValidator, format_violations
+
+
+class Mark:
+    def __init__(self, name):
+        self.name = name
+
+
+class Node:
+    """
+    Minimal collection node: a nodeid, own markers and a parent.
+    """
+
+    def __init__(self, nodeid, markers=(), parent=None):
+        self.nodeid = nodeid
+        self.own_markers = [Mark(name) for name in markers]
+        self.parent = parent
+
+
+class CountingNode(Node):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = 0
+
+    @property
+    def own_markers(self):
+        self.reads += 1
+        return self._own_markers
+
+    @own_markers.setter
+    def own_markers(self, value):
+        self._own_markers = value
+
+
+# ---------------------------------------------------------------------
+# INVARIANTS — VALIDATION
+# ---------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_marker_validator_accepts_inherited_level_and_scope():
+    """
+    Invariant:
+    Markers of every ancestor apply to an item.
+    """
+
+    package = Node("pkg", ["domain"])
+    module = Node("pkg/test_a.py", ["unit"], parent=package)
+    items = [Node("pkg/test_a.py::test_a", parent=module)]
+
+    assert MarkerValidator().validate(items) == []
+
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_marker_validator_reports_every_violation_in_order():
+    """
+    Invariant:
+    Missing LEVEL and SCOPE markers are both reported, for every
+    item, in collection order.
+    """
+
+    module = Node("test_a.py")
+    items = [
+        Node("test_a.py::test_none", parent=module),
+        Node("test_a.py::test_level", ["unit"], parent=module),
+        Node("test_a.py::test_scope", ["domain"], parent=module),
+        Node("test_a.py::test_ok", ["unit", "domain"], parent=module),
+    ]
+
+    violations = MarkerValidator().validate(items)
+
+    assert [(v.nodeid, v.category) for v in violations] == [
+        ("test_a.py::test_none", "LEVEL"),
+        ("test_a.py::test_none", "SCOPE"),
+        ("test_a.py::test_level", "SCOPE"),
+        ("test_a.py::test_scope", "LEVEL"),
+    ]
+    assert format_violations(violations).startswith("4 marker violation(s):")
+
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_marker_validator_ignores_execution_markers():
+    """
+    Invariant:
+    Execution markers (slow, benchmark, ...) satisfy neither category.
+    """
+
+    items = [Node("test_a.py::test_a", ["slow", "benchmark"], parent=Node("test_a.py"))]
+
+    categories = {v.category for v in MarkerValidator().validate(items)}
+
+    assert categories == {"LEVEL", "SCOPE"}
+
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_marker_validator_resolves_each_parent_once():
+    """
+    Invariant:
+    Module markers are read once per module, not once per item.
+    """
+
+    module = CountingNode("test_a.py", ["unit", "domain"])
+    items = [Node(f"test_a.py::test_{idx}", parent=module) for idx in range(100)]
+
+    assert MarkerValidator().validate(items) == []
+    assert module.reads == 1